@@ -1,70 +1,127 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import numpy as np
-
-st.title("🚇 2025년 10월 지하철 승·하차 분석")
-
-# CSV 불러오기
-@st.cache_data
-def load_data():
-    return pd.read_csv("dubbongispig.csv", encoding="cp949")
-
-df = load_data()
-
-# 날짜 목록 만들기
-df['사용일자'] = df['사용일자'].astype(str)
-unique_dates = sorted(df['사용일자'].unique())
-
-# 호선 목록
-lines = sorted(df["노선명"].unique())
-
-# 사용자 입력
-col1, col2 = st.columns(2)
-with col1:
-    selected_date = st.selectbox("📅 날짜 선택 (2025년 10월)", unique_dates)
-
-with col2:
-    selected_line = st.selectbox("🚈 호선 선택", lines)
-
-# 필터링
-filtered = df[(df["사용일자"] == selected_date) & (df["노선명"] == selected_line)].copy()
-
-# 승·하차 총합 계산
-filtered["총승하차"] = filtered["승차총승객수"] + filtered["하차총승객수"]
-filtered = filtered.sort_values("총승하차", ascending=False)
-
-# 색상 설정: 1등은 빨간색, 나머지는 파란색 그라데이션
-colors = []
-blue_base = np.array([0, 0, 255])    # 파란색
-red = "rgb(255,0,0)"
-
-if len(filtered) > 0:
-    for i in range(len(filtered)):
-        if i == 0:
-            colors.append(red)
-        else:
-            ratio = i / len(filtered)
-            blue_tone = blue_base * (1 - ratio)
-            colors.append(f"rgb({int(blue_tone[0])},{int(blue_tone[1])},{int(blue_tone[2])})")
-
-# Plotly 그래프
-fig = px.bar(
-    filtered,
-    x="역명",
-    y="총승하차",
-    title=f"{selected_date} · {selected_line} 승·하차 TOP 역",
-)
-
-# 색 적용
-fig.update_traces(marker_color=colors)
 
-fig.update_layout(
-    xaxis_title="역명",
-    yaxis_title="승·하차 총합",
-    title_font_size=22,
-    template="plotly_white",
+from common import perf
+from common.charts import (
+    FIGURE_CACHE,
+    daily_series_chart,
+    station_ranking_chart,
+    weekday_weekend_chart,
 )
-
-st.plotly_chart(fig, use_container_width=True)
-
+from common.artifacts import subway_rankings
+from common.data import frame_nbytes, resolve_path
+from common.refresh import Refresher
+from common.subway import DATA_FILE, RidershipMatrix, load_subway, split_rankings, top_k_stations
+
+# 백그라운드 스레드(common.refresh)가 승·하차 파일을 지켜보다가 바뀌면, 미리 정렬해 둔 순위 파일
+# (python -m common.precompute)로 (날짜, 호선) 인덱스와 한 달 보기용 (날짜 × 역) 행렬을 새로 만들어 통째로 바꿔 끼웁니다.
+# 리런은 파일을 읽지 않고 지금 들고 있는 버전을 모든 세션이 같이 씁니다.
+def build_dataset():
+    index, unique_dates, lines = split_rankings(subway_rankings())
+    matrix = RidershipMatrix(load_subway())
+    perf.record_dataset("subway_index", sum(frame_nbytes(frame) for frame in index.values()))
+    perf.record_dataset("subway_matrix", matrix.nbytes)
+    return index, unique_dates, lines, matrix
+
+@st.cache_resource(on_release=Refresher.stop)
+def subway_source():
+    perf.mark_miss()
+    return Refresher("subway", DATA_FILE, build_dataset).start()
+
+# 하루 보기에서 막대로 그릴 상위 역 수 (나머지는 '기타' 막대 하나로 묶음)
+TOP_K_OPTIONS = [10, 20, 30, "전체"]
+
+
+def show_day():
+    # 사용자 입력
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        selected_date = st.selectbox("📅 날짜 선택 (2025년 10월)", unique_dates)
+
+    with col2:
+        selected_line = st.selectbox("🚈 호선 선택", lines)
+
+    with col3:
+        top_k = st.selectbox("🏅 상위 역 수", TOP_K_OPTIONS)
+    k = None if top_k == "전체" else top_k
+
+    def build_chart():
+        # 필터링: 이미 총승하차 순으로 정렬된 역 목록을 바로 꺼냅니다.
+        filtered = station_index.get((selected_date, selected_line))
+        if filtered is None:
+            filtered = pd.DataFrame(columns=["역명", "총승하차"])
+        top, others = top_k_stations(filtered, k)
+        return station_ranking_chart(top, selected_date, selected_line, others)
+
+    # 같은 (데이터 버전, 날짜, 호선, 상위 역 수)면 만들어 둔 그래프를 재사용합니다.
+    with perf.stage("figure"):
+        fig = FIGURE_CACHE.get_or_build(("subway", data_version, selected_date, selected_line, k), build_chart)
+
+    with perf.stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def show_month():
+    selected_line = st.selectbox("🚈 호선 선택", matrix.lines)
+    cols = matrix.stations_of(selected_line)
+    names = list(matrix.station_names[cols])
+    selected_names = st.multiselect("🚉 역 선택 (기본: 한 달 합계 상위 5개 역)", names, default=names[:5])
+    selected_cols = cols[[names.index(name) for name in selected_names]]
+
+    # 호선 전체 일별 합계
+    with perf.stage("figure"):
+        fig = FIGURE_CACHE.get_or_build(
+            ("subway_month_line", data_version, selected_line),
+            lambda: daily_series_chart(
+                matrix.dates,
+                {selected_line: matrix.line_series(selected_line)},
+                matrix.weekend,
+                f"{selected_line} 일별 승·하차 (회색: 주말)",
+            ),
+        )
+    st.plotly_chart(fig, use_container_width=True)
+
+    if not selected_names:
+        st.info("역을 하나 이상 선택해 주세요.")
+        return
+
+    # 선택한 역들의 일별 추이
+    with perf.stage("figure"):
+        fig = FIGURE_CACHE.get_or_build(
+            ("subway_month_stations", data_version, selected_line, tuple(selected_names)),
+            lambda: daily_series_chart(
+                matrix.dates,
+                dict(zip(selected_names, matrix.station_series(selected_cols).T)),
+                matrix.weekend,
+                f"{selected_line} 역별 일별 승·하차",
+            ),
+        )
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 평일 vs 주말 하루 평균
+    weekday, weekend = matrix.weekday_weekend(selected_cols)
+    with perf.stage("figure"):
+        fig = FIGURE_CACHE.get_or_build(
+            ("subway_month_split", data_version, selected_line, tuple(selected_names)),
+            lambda: weekday_weekend_chart(selected_names, weekday, weekend, f"{selected_line} 평일 vs 주말"),
+        )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+with perf.rerun("04_지하철분석"):
+    st.title("🚇 2025년 10월 지하철 승·하차 분석")
+
+    with perf.stage("dataset", cache=True):
+        data_version, dataset = subway_source().get()
+
+    if dataset is None:
+        st.error(f"❌ 승·하차 데이터 파일을 찾을 수 없습니다: {resolve_path(DATA_FILE)}")
+        st.stop()
+
+    station_index, unique_dates, lines, matrix = dataset
+
+    view = st.radio("🔎 보기", ["하루 보기", "한 달 보기"], horizontal=True)
+    if view == "하루 보기":
+        show_day()
+    else:
+        show_month()
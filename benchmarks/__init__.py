@@ -0,0 +1 @@
+"""페이지별 데이터/그래프 핫패스 벤치마크 (Streamlit 없이 실행)."""
@@ -0,0 +1,103 @@
+"""페이지별 import 시간 보고서입니다. (`python -X importtime`을 페이지마다 따로 돌려 정리)
+
+    python -m benchmarks.importtime                 # 모든 페이지
+    python -m benchmarks.importtime main.py --top 20
+    python -m benchmarks.importtime --check         # 가벼운 페이지가 무거운 라이브러리를 불러오면 종료 코드 1
+
+페이지마다 새 파이썬 프로세스에서 스크립트를 한 번 실행하고(Streamlit bare 모드),
+`import streamlit`만 했을 때 불러오는 모듈은 빼고 그 페이지가 더 불러온 것만 셉니다.
+데이터 파일이 없어 페이지가 중간에 실패해도, 그 전까지의 import는 그대로 보고합니다.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# 불러오는 데 오래 걸리는 라이브러리 (최상위 패키지 이름)
+HEAVY = ("pandas", "numpy", "pyarrow", "plotly", "folium", "branca", "streamlit_folium", "scipy")
+
+# 무거운 라이브러리를 하나도 불러오면 안 되는 페이지
+LIGHT_PAGES = ("main.py", "pages/00_mbti진로.py")
+
+_RUNNER = """
+import runpy, sys
+try:
+    runpy.run_path(sys.argv[1], run_name="__main__")
+except BaseException:
+    pass
+"""
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def pages():
+    return ["main.py"] + sorted(p.name for p in ROOT_DIR.glob("*_*.py")) + sorted(
+        f"pages/{p.name}" for p in (ROOT_DIR / "pages").glob("*.py")
+    )
+
+
+def import_times(code, *args):
+    """새 프로세스에서 code를 실행하고 {모듈 이름: (자기 시간 us, 누적 시간 us, 깊이)}를 돌려줍니다."""
+    env = dict(os.environ, PYTHONWARNINGS="ignore")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules
+
+
+def page_report(page, baseline):
+    """페이지가 streamlit 외에 더 불러온 모듈을 최상위 패키지별로 합칩니다."""
+    modules = {
+        name: times for name, times in import_times(_RUNNER, page).items() if name not in baseline
+    }
+    packages = defaultdict(int)
+    for name, (self_us, _, _) in modules.items():
+        packages[name.split(".")[0]] += self_us
+    return {
+        "page": page,
+        "total_ms": sum(self_us for self_us, _, _ in modules.values()) / 1000,
+        "modules": len(modules),
+        "packages": dict(sorted(packages.items(), key=lambda item: -item[1])),
+        "heavy": [pkg for pkg in HEAVY if pkg in packages],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="보고할 페이지 (기본: 전부)")
+    parser.add_argument("--top", type=int, default=8, help="페이지마다 보여줄 패키지 수")
+    parser.add_argument("--check", action="store_true", help="가벼운 페이지가 무거운 라이브러리를 불러오면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    baseline = import_times("import streamlit")
+    print(f"기준: import streamlit {sum(t[0] for t in baseline.values()) / 1000:.0f} ms ({len(baseline)}개 모듈, 아래 숫자에서 제외)\n")
+
+    status = 0
+    for page in args.pages or pages():
+        report = page_report(page, baseline)
+        print(f"{report['page']:<28} {report['total_ms']:8.1f} ms  모듈 {report['modules']}개")
+        for pkg, self_us in list(report["packages"].items())[: args.top]:
+            mark = " *" if pkg in HEAVY else ""
+            print(f"    {pkg:<24} {self_us / 1000:8.1f} ms{mark}")
+
+        if args.check and page in LIGHT_PAGES and report["heavy"]:
+            status = 1
+            print(f"    ✗ 가벼운 페이지가 {', '.join(report['heavy'])}을(를) 불러옵니다.")
+        print()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+"""동시 접속 부하 테스트. 로컬에 Streamlit 서버(워커 하나)를 띄우고 웹소켓 세션 여러 개로 동시에 리런합니다.
+
+    python -m benchmarks.loadtest                          # 30세션 × 리런 20번
+    python -m benchmarks.loadtest --sessions 60 --reruns 10 --pages 04 00
+    python -m benchmarks.loadtest --think 0.5 --subway-rows 200000
+
+세션 하나는 브라우저 탭 하나와 같습니다. 페이지를 열고 위젯을 무작위로 바꿔 가며 리런합니다.
+- 04: 04_지하철분석 날짜·호선 선택
+- 02: 02_관광지 여행 일수 슬라이더
+- 00: 00_mbti진로 MBTI 선택
+리런 지연은 위젯 값을 보낸 때부터 서버가 script_finished를 보낼 때까지입니다.
+처리량(리런/초), 리런 지연 p50/p95/p99, 세션당 메모리(서버 RSS 증가분 ÷ 세션 수)를 보여줍니다.
+
+데이터는 임시 폴더에 만든 합성 승·하차 CSV를 쓰고(DUBBONG_DATA_DIR), 앱의 .cache는 건드리지 않습니다.
+웹소켓 클라이언트는 Streamlit이 의존하는 websockets 패키지를 씁니다.
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from benchmarks import synthetic
+from common.mbti import MBTI_TYPES
+from common.subway import DATA_FILE
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+APP_FILE = ROOT_DIR / "04_지하철분석.py"  # pages/ 폴더의 페이지도 같이 서비스됩니다.
+
+# 데이터 폴더로 그대로 복사하는 작은 파일들
+STATIC_FILES = ("seoul_pois.csv", "subway_stations.csv", "mbti_careers.json")
+
+# 서버가 뜨기를 기다리는 최대 시간(초)
+STARTUP_TIMEOUT = 60
+
+
+# 위젯 값 바꾸기: {라벨 앞부분: (값 종류, 값)}
+def _change_subway(session):
+    return {
+        "📅 날짜 선택": ("string_value", session.pick("📅 날짜 선택")),
+        "🚈 호선 선택": ("string_value", session.pick("🚈 호선 선택")),
+    }
+
+
+def _change_tourism(session):
+    return {"여행 일수": ("double_array_value", [float(session.rng.randint(1, 3))])}
+
+
+def _change_mbti(session):
+    return {"본인의 MBTI": ("string_value", session.rng.choice(MBTI_TYPES))}
+
+
+# 페이지 → (URL 경로 이름, 리런 전에 바꿀 위젯 값을 고르는 함수)
+PAGES = {
+    "04": ("", _change_subway),
+    "02": ("관광지", _change_tourism),
+    "00": ("mbti진로", _change_mbti),
+}
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_bytes(pid):
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def prepare_data(data_dir, subway_rows):
+    data_dir.mkdir(parents=True, exist_ok=True)
+    for name in STATIC_FILES:
+        shutil.copy(ROOT_DIR / name, data_dir / name)
+    synthetic.make_subway_csv(data_dir / DATA_FILE, subway_rows)
+
+
+def start_server(workdir, port):
+    env = dict(
+        os.environ,
+        DUBBONG_DATA_DIR=str(workdir / "data"),
+        DUBBONG_CACHE_DIR=str(workdir / "cache"),
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(APP_FILE),
+            "--server.headless=true",
+            f"--server.port={port}",
+            "--server.fileWatcherType=none",
+            "--browser.gatherUsageStats=false",
+        ],
+        cwd=ROOT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("Streamlit 서버가 시작하지 못했습니다.")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("Streamlit 서버가 제한 시간 안에 응답하지 않았습니다.")
+
+
+class Session:
+    """웹소켓 연결 하나 = 브라우저 탭 하나. 마지막 리런에서 받은 위젯 목록과 보낸 값을 들고 있습니다."""
+
+    def __init__(self, url, page, seed):
+        self.url = url
+        self.page = page
+        self.page_name, self.change = PAGES[page]
+        self.rng = random.Random(seed)
+        self.ws = None
+        self.widgets = {}  # 라벨 → (위젯 id, 선택지)
+        self.values = {}  # 위젯 id → (값 종류, 값)
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        await self.ws.close()
+
+    def _widget(self, prefix):
+        for label, widget in self.widgets.items():
+            if label.startswith(prefix):
+                return widget
+        raise KeyError(prefix)
+
+    def pick(self, prefix):
+        """라벨이 prefix로 시작하는 선택 위젯의 선택지 중 하나를 무작위로 고릅니다."""
+        return self.rng.choice(self._widget(prefix)[1])
+
+    async def rerun(self, change=True):
+        """리런 한 번의 (걸린 시간 초, 오류 여부)"""
+        if change:
+            for prefix, value in self.change(self).items():
+                self.values[self._widget(prefix)[0]] = value
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_name = self.page_name
+        for widget_id, (kind, value) in self.values.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            if kind == "double_array_value":
+                state.double_array_value.data.extend(value)
+            else:
+                setattr(state, kind, value)
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        failed = False
+        self.widgets = {}
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    failed = True
+                elif element_type in ("selectbox", "slider"):
+                    widget = getattr(element, element_type)
+                    self.widgets[widget.label] = (widget.id, list(widget.options))
+            elif kind == "script_finished":
+                status = fwd.script_finished
+                if status == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                failed |= status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR
+                return time.perf_counter() - start, failed
+
+
+async def drive(url, pages, sessions, reruns, think, server_pid):
+    # 공용 캐시를 먼저 채워 둡니다. (처음 한 번의 데이터 로드는 결과에서 뺌)
+    for page in pages:
+        warm = Session(url, page, seed=-1)
+        await warm.connect()
+        await warm.rerun(change=False)
+        await warm.close()
+
+    rss_before = rss_bytes(server_pid)
+    all_sessions = [Session(url, pages[i % len(pages)], seed=i) for i in range(sessions)]
+    latencies = {page: [] for page in pages}
+    errors = {page: 0 for page in pages}
+
+    async def one(session):
+        await session.connect()
+        for i in range(reruns):
+            elapsed, failed = await session.rerun(change=i > 0)
+            latencies[session.page].append(elapsed)
+            errors[session.page] += failed
+            if think:
+                await asyncio.sleep(session.rng.uniform(0, 2 * think))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(session) for session in all_sessions))
+    wall = time.perf_counter() - start
+    # 세션을 닫기 전에 재야 세션 상태가 메모리에 남아 있습니다.
+    rss_after = rss_bytes(server_pid)
+    await asyncio.gather(*(session.close() for session in all_sessions))
+
+    return {
+        "wall": wall,
+        "latencies": latencies,
+        "errors": errors,
+        "session_bytes": max(rss_after - rss_before, 0) / sessions,
+        "server_bytes": rss_after,
+    }
+
+
+def _row(name, values, errors, wall):
+    p50, p95, p99 = np.percentile(values, [50, 95, 99]) * 1000
+    return f"{name:<6} {len(values):>7} {len(values) / wall:>9.1f} {p50:>9.1f} {p95:>9.1f} {p99:>9.1f} {errors:>6}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=30, help="동시 세션 수")
+    parser.add_argument("--reruns", type=int, default=20, help="세션당 리런 수 (첫 페이지 열기 포함)")
+    parser.add_argument("--think", type=float, default=0.0, help="리런 사이 평균 대기 시간(초). 0이면 쉬지 않고 리런")
+    parser.add_argument("--pages", nargs="+", choices=sorted(PAGES), default=["04", "02", "00"], help="세션을 나눠 줄 페이지")
+    parser.add_argument("--subway-rows", type=int, default=20_000, help="합성 승·하차 데이터 행 수")
+    args = parser.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="dubbong-load-"))
+    server = None
+    try:
+        prepare_data(workdir / "data", args.subway_rows)
+        port = _free_port()
+        server = start_server(workdir, port)
+        print(f"세션 {args.sessions}개 × 리런 {args.reruns}번 · 페이지 {', '.join(args.pages)} · CPU {os.cpu_count()}개\n")
+        result = asyncio.run(drive(
+            f"ws://127.0.0.1:{port}/_stcore/stream", args.pages, args.sessions, args.reruns, args.think, server.pid,
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    wall = result["wall"]
+    print(f"{'페이지':<4} {'리런':>7} {'리런/초':>7} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'오류':>5}")
+    for page, values in result["latencies"].items():
+        print(_row(page, values, result["errors"][page], wall))
+    everything = [v for values in result["latencies"].values() for v in values]
+    print(_row("전체", everything, sum(result["errors"].values()), wall))
+    print(
+        f"\n걸린 시간 {wall:.2f}s · 서버 RSS {result['server_bytes'] / 2**20:.1f} MiB"
+        f" · 세션당 메모리 약 {result['session_bytes'] / 2**20:.2f} MiB (RSS 증가분 ÷ 세션 수)"
+    )
+    return 1 if sum(result["errors"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""페이지별 핫패스 벤치마크를 Streamlit 없이 실행합니다.
+
+    python -m benchmarks.run                       # 10×, 100×, 1000× 데이터로 측정
+    python -m benchmarks.run --scales 10 100 --save   # 결과를 기준값(baseline)으로 저장
+    python -m benchmarks.run --compare             # 저장된 기준값과 비교해 느려진 항목 표시
+
+각 항목은 여러 번 실행해 가장 빠른 시간(wall time)을 쓰고, tracemalloc으로 한 번 더 실행해
+파이썬/NumPy/pandas가 잡은 최대 메모리(peak)를 잽니다. (Arrow 내부 메모리는 포함되지 않습니다)
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# 벤치마크가 만든 컬럼형 캐시가 앱의 .cache를 건드리지 않도록 먼저 캐시 폴더를 바꿉니다.
+_WORKDIR = Path(tempfile.mkdtemp(prefix="dubbong-bench-"))
+os.environ.setdefault("DUBBONG_CACHE_DIR", str(_WORKDIR / "cache"))
+
+import numpy as np  # noqa: E402
+from streamlit_folium import generate_leaflet_string  # noqa: E402
+
+import common.data as data  # noqa: E402
+import common.paths as paths  # noqa: E402
+from benchmarks import synthetic  # noqa: E402
+from common.charts import station_ranking_chart  # noqa: E402
+from common.distribution import size_distribution  # noqa: E402
+from common.itinerary import _plan, plan_itinerary  # noqa: E402
+from common.livestock import compact_livestock, load_livestock, prepare_livestock  # noqa: E402
+from common.maps import MAX_VIEWPORT_POIS, build_base_map, cluster_layer  # noqa: E402
+from common.pois import GridIndex, attach_popups  # noqa: E402
+from common.subway import build_station_index, load_subway  # noqa: E402
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# 기준값보다 이 비율 이상, 그리고 이 시간 이상 느려지면 회귀로 표시합니다. (아주 짧은 항목의 흔들림은 무시)
+REGRESSION_RATIO = 1.2
+REGRESSION_MIN_SECONDS = 0.005
+
+# 거리 행렬이 n² 이라 이보다 큰 관광지 수에서는 일정 계산을 건너뜁니다.
+ITINERARY_MAX_POIS = 2000
+
+
+def _load_page_module(filename, name):
+    """페이지 스크립트를 모듈로 불러옵니다. (07 페이지는 main()을 __main__일 때만 실행함)"""
+    spec = importlib.util.spec_from_file_location(name, ROOT_DIR / "pages" / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(func, repeat):
+    """(가장 빠른 실행 시간 초, 최대 메모리 바이트)를 돌려줍니다."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def _fresh_cache():
+    # 캐시가 비어 있는 상태(콜드 스타트)를 흉내 냅니다.
+    # (데이터 버전 메타 파일은 common.paths, 컬럼형 파일은 common.data가 씀)
+    data.CACHE_DIR = paths.CACHE_DIR = Path(tempfile.mkdtemp(dir=_WORKDIR))
+
+
+def build_cases(scale, workdir):
+    """scale배 합성 데이터를 만들고 (항목 이름, 측정할 함수) 목록을 돌려줍니다."""
+    livestock_csv = workdir / f"livestock_x{scale}.csv"
+    subway_csv = workdir / f"subway_x{scale}.csv"
+    n_livestock = synthetic.make_livestock_csv(livestock_csv, scale)
+    synthetic.make_subway_csv(subway_csv, n_livestock)
+    pois = attach_popups(synthetic.make_pois(10 * scale))
+
+    page07 = _load_page_module("07_수행평가.py", "page07_bench")
+
+    livestock = load_livestock(livestock_csv)
+    latest_year = int(livestock["Year"].max())
+    subway = load_subway(subway_csv)
+    station_index, dates, lines = build_station_index(subway)
+
+    rng = np.random.default_rng(0)
+    selections = [(dates[rng.integers(len(dates))], lines[rng.integers(len(lines))]) for _ in range(50)]
+    grid = GridIndex(pois["lat"], pois["lon"])
+    viewport = (37.54, 126.95, 37.59, 127.02)
+
+    def livestock_parse_csv():
+        compact_livestock(prepare_livestock(data.read_csv_any(livestock_csv)))
+
+    def livestock_load_cold():
+        _fresh_cache()
+        load_livestock(livestock_csv)
+
+    def livestock_load_warm():
+        load_livestock(livestock_csv)
+
+    def livestock_bar_chart():
+        page07.create_custom_bar_chart(livestock[livestock["Year"] == latest_year], f"{latest_year}년")
+
+    def livestock_distribution():
+        size_distribution(livestock)
+
+    def subway_load_cold():
+        _fresh_cache()
+        load_subway(subway_csv)
+
+    def subway_index_build():
+        build_station_index(subway)
+
+    def subway_scan_sort():
+        # 인덱스를 쓰기 전 방식: 선택마다 전체를 거르고 정렬
+        for date, line in selections:
+            filtered = subway[(subway["사용일자"] == date) & (subway["노선명"] == line)]
+            filtered.sort_values("총승하차", ascending=False)
+
+    def subway_index_lookup():
+        for key in selections:
+            station_index.get(key)
+
+    def subway_bar_chart():
+        date, line = selections[0]
+        station_ranking_chart(station_index[(date, line)], date, line)
+
+    def poi_grid_query():
+        grid.query(*viewport)
+
+    def folium_map_build():
+        shown = grid.query(*viewport)[:MAX_VIEWPORT_POIS]
+        m = build_base_map()
+        layer = cluster_layer(pois.iloc[shown])
+        # st_folium과 같은 순서: 기본 지도 문자열을 만든 뒤 레이어를 붙여서 따로 문자열로 만듦
+        m.get_root().render()
+        generate_leaflet_string(m)
+        layer.add_to(m)
+        layer.render()
+        generate_leaflet_string(layer, base_id="feature_group_0")
+
+    cases = [
+        ("livestock.parse_csv", livestock_parse_csv),
+        ("livestock.load_cold", livestock_load_cold),
+        ("livestock.load_warm", livestock_load_warm),
+        ("livestock.bar_chart", livestock_bar_chart),
+        ("livestock.distribution", livestock_distribution),
+        ("subway.load_cold", subway_load_cold),
+        ("subway.index_build", subway_index_build),
+        ("subway.scan_sort_x50", subway_scan_sort),
+        ("subway.index_lookup_x50", subway_index_lookup),
+        ("subway.bar_chart", subway_bar_chart),
+        ("tourism.grid_query", poi_grid_query),
+        ("tourism.folium_map", folium_map_build),
+    ]
+
+    if len(pois) <= ITINERARY_MAX_POIS:
+        locations = pois.to_dict("records")
+
+        def itinerary_plan():
+            # 메모해 둔 결과를 지우고 매번 새로 계산합니다.
+            _plan.cache_clear()
+            plan_itinerary(locations, 3)
+
+        cases.append(("tourism.itinerary", itinerary_plan))
+
+    return cases
+
+
+def run(scales, repeat):
+    results = {}
+    for scale in scales:
+        workdir = Path(tempfile.mkdtemp(dir=_WORKDIR))
+        for name, func in build_cases(scale, workdir):
+            seconds, peak = measure(func, repeat)
+            key = f"{name}@x{scale}"
+            results[key] = {"seconds": seconds, "peak_bytes": peak}
+            print(f"{key:<34} {seconds * 1000:>10.2f} ms {peak / 2**20:>10.1f} MiB", flush=True)
+    return results
+
+
+def compare(results, baseline):
+    """기준값 대비 시간 비율을 출력하고, 느려진 항목 수를 돌려줍니다."""
+    regressions = 0
+    print(f"\n{'항목':<34} {'기준':>10} {'현재':>10} {'비율':>7}")
+    for key, now in results.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        ratio = now["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        slower = now["seconds"] - before["seconds"] >= REGRESSION_MIN_SECONDS
+        flag = "  ⚠ 느려짐" if ratio >= REGRESSION_RATIO and slower else ""
+        regressions += bool(flag)
+        print(
+            f"{key:<34} {before['seconds'] * 1000:>8.2f}ms {now['seconds'] * 1000:>8.2f}ms {ratio:>6.2f}x{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[10, 100, 1000], help="원본 대비 데이터 배율")
+    parser.add_argument("--repeat", type=int, default=3, help="항목당 반복 횟수 (가장 빠른 시간을 씀)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="기준값 JSON 파일 경로")
+    parser.add_argument("--save", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--compare", action="store_true", help="저장된 기준값과 비교 (느려진 항목이 있으면 종료 코드 1)")
+    args = parser.parse_args(argv)
+
+    # 기준값 파일은 측정을 시작하기 전에 읽어 둡니다. (몇 분 측정한 뒤에야 파일이 없다고 끝나지 않게)
+    baseline = None
+    if args.compare:
+        if not args.baseline.exists():
+            parser.error(f"기준값 파일이 없습니다: {args.baseline} (먼저 --save로 만들어 주세요)")
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+
+    print(f"python {platform.python_version()} · {platform.machine()} · 원본 {synthetic.base_rows():,}행\n")
+    results = run(args.scales, args.repeat)
+
+    status = 0
+    if baseline is not None:
+        status = 1 if compare(results, baseline) else 0
+
+    if args.save:
+        payload = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        args.baseline.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n기준값 저장: {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
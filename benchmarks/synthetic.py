@@ -0,0 +1,68 @@
+"""벤치마크용 합성 데이터 생성기. 현재 dubbongispig.csv 크기(행 수)의 scale배 데이터를 만듭니다."""
+import numpy as np
+import pandas as pd
+
+from common.data import read_csv_any, resolve_path
+from common.livestock import DATA_FILE
+
+SEOUL_BBOX = (37.45, 126.80, 37.70, 127.15)
+
+
+def base_rows():
+    return len(read_csv_any(DATA_FILE))
+
+
+def make_livestock_csv(path, scale, seed=0):
+    """원본 가축 CSV를 scale번 이어 붙이고, 복사본마다 시군 이름과 두수를 조금씩 바꿉니다."""
+    rng = np.random.default_rng(seed)
+    raw = read_csv_any(resolve_path(DATA_FILE))
+    id_col, sigungu_col = raw.columns[0], raw.columns[3]
+    count_cols = raw.columns[5:]
+
+    copies = []
+    for k in range(scale):
+        copy = raw.copy()
+        if k:
+            copy[sigungu_col] = copy[sigungu_col] + str(k)
+            noise = rng.integers(0, 3, size=(len(copy), len(count_cols)))
+            copy[count_cols] = copy[count_cols].to_numpy() + noise
+        copies.append(copy)
+    df = pd.concat(copies, ignore_index=True)
+    df[id_col] = np.arange(1, len(df) + 1)
+    df.to_csv(path, index=False, encoding="cp949")
+    return len(df)
+
+
+def make_subway_csv(path, n_rows, seed=0):
+    """31일 × 9개 호선 × (행 수에 맞춘) 역 개수의 승·하차 데이터를 만듭니다."""
+    rng = np.random.default_rng(seed)
+    dates = [str(20251001 + d) for d in range(31)]
+    lines = [f"{i}호선" for i in range(1, 10)]
+    per_line = max(1, round(n_rows / (len(dates) * len(lines))))
+
+    date_col = np.repeat(dates, len(lines) * per_line)
+    line_col = np.tile(np.repeat(lines, per_line), len(dates))
+    station_col = np.tile([f"{line}-역{i}" for line in lines for i in range(per_line)], len(dates))
+    n = len(date_col)
+    df = pd.DataFrame({
+        "사용일자": date_col,
+        "노선명": line_col,
+        "역명": station_col,
+        "승차총승객수": rng.integers(100, 80000, n),
+        "하차총승객수": rng.integers(100, 80000, n),
+    })
+    df.to_csv(path, index=False, encoding="cp949")
+    return n
+
+
+def make_pois(n, seed=0):
+    """서울 영역 안에 무작위로 흩어진 관광지 n개를 만듭니다."""
+    rng = np.random.default_rng(seed)
+    south, west, north, east = SEOUL_BBOX
+    return pd.DataFrame({
+        "name": [f"명소{i}" for i in range(n)],
+        "lat": south + rng.random(n) * (north - south),
+        "lon": west + rng.random(n) * (east - west),
+        "desc": "합성 관광지 설명입니다.",
+        "subway": "",
+    })
@@ -0,0 +1 @@
+"""여러 페이지가 함께 쓰는 데이터/차트 공용 모듈 모음입니다."""
@@ -0,0 +1,146 @@
+"""페이지가 시작할 때 바로 여는 미리 만든 결과물(아티팩트)입니다.
+
+파일 이름에 원본 파일 버전과 빌드 태그(만드는 코드의 소스 해시, 매개변수, ARTIFACT_FORMAT)가 들어가므로,
+원본이 바뀌거나 만드는 코드가 바뀌면(배포) 자동으로 새로 만듭니다.
+배포 직후에는 `python -m common.precompute`로 한꺼번에 만들어 두면 첫 방문자가 기다리지 않습니다.
+"""
+import hashlib
+
+import pandas as pd
+
+from common.data import file_version, read_arrow, write_arrow
+from common.distribution import size_distribution
+from common.livestock import DATA_FILE as LIVESTOCK_FILE, load_livestock, sigungu_totals, stream_livestock
+from common.paths import CACHE_DIR, code_version
+from common.subway import DATA_FILE as SUBWAY_FILE, load_subway, rank_stations, station_ridership, stream_subway
+
+# 관광지 표는 folium(팝업)과 scipy(KD-tree)가 필요해서, 04·07 페이지가 이 모듈을 불러올 때
+# 같이 딸려오지 않도록 common.pois / common.stations는 함수 안에서 불러옵니다.
+
+ARTIFACT_DIR = CACHE_DIR / "artifacts"
+
+# 아티팩트 파일 형식. 저장 방식을 바꾸면 올려서 모든 아티팩트를 새로 만들게 합니다.
+ARTIFACT_FORMAT = 1
+
+# True면 저장된 아티팩트를 무시하고 다시 만듭니다. (python -m common.precompute --force)
+FORCE = False
+
+# 관광지마다 연결할 가까운 역 수
+NEAREST_STATIONS = 2
+
+# 가까운 역(MAX_STATION_KM 안)이 하나도 없는 관광지에 보여줄 문구
+NO_STATION = "가까운 역 없음"
+
+
+def artifact_version(*versions):
+    """여러 원본 버전을 하나의 버전 문자열로 합칩니다."""
+    return hashlib.sha1("|".join(versions).encode()).hexdigest()
+
+
+def build_tag(*modules, **params):
+    """아티팩트를 만드는 코드(모듈 이름들)와 매개변수가 바뀌면 달라지는 짧은 문자열입니다."""
+    return code_version(*modules, artifact_format=ARTIFACT_FORMAT, **params)
+
+
+def artifact_path(name, tag, version):
+    return ARTIFACT_DIR / f"{name}.{tag}.{version[:16]}.arrow"
+
+
+def cached_artifact(name, tag, version, build):
+    """저장된 아티팩트가 있으면 열고, 없으면 build()로 만들어 저장한 뒤 돌려줍니다."""
+    path = artifact_path(name, tag, version)
+    if path.exists() and not FORCE:
+        return read_arrow(path)
+
+    df = build()
+    write_arrow(df, path)
+
+    # 이전 버전(원본이나 빌드 태그가 다른) 파일은 지웁니다.
+    for old in ARTIFACT_DIR.glob(f"{name}.*.arrow"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return df
+
+
+def livestock_sigungu(file_path=LIVESTOCK_FILE):
+    """연도·시군별 전체 두수 합계 (07 페이지 시군별 순위 그래프)
+
+    원본 전체를 올리지 않고 조각 단위로 읽으면서 바로 (연도, 시군) 합계를 냅니다.
+    """
+    return cached_artifact(
+        "livestock_sigungu",
+        build_tag("common.data", "common.livestock"),
+        file_version(file_path),
+        lambda: sigungu_totals(stream_livestock(file_path, group_by=['Year', 'Sigungu'])),
+    )
+
+
+def livestock_distribution(file_path=LIVESTOCK_FILE):
+    """품종·시도·연도별 농가 규모 분포 지표 (07 페이지)"""
+    return cached_artifact(
+        "livestock_distribution",
+        build_tag("common.distribution", "common.livestock"),
+        file_version(file_path),
+        lambda: size_distribution(load_livestock(file_path)),
+    )
+
+
+def subway_rankings(file_path=SUBWAY_FILE):
+    """(날짜, 호선) 안에서 총승하차 내림차순으로 정렬된 승·하차 프레임 (04 페이지)"""
+    return cached_artifact(
+        "subway_rankings",
+        build_tag("common.subway"),
+        file_version(file_path),
+        lambda: rank_stations(load_subway(file_path)),
+    )
+
+
+def _ridership_or_none():
+    try:
+        # 조각 단위로 읽으면서 역별 합계만 남깁니다. (전체 기간 행을 한꺼번에 올리지 않음)
+        return station_ridership(stream_subway(group_by=["노선명", "역명"]))
+    except KeyError:
+        # 승·하차 데이터가 아닌 파일이면 이용객 수 없이 역만 연결합니다.
+        return None
+
+
+def build_poi_table(k=NEAREST_STATIONS):
+    """관광지마다 가까운 역 k개를 연결하고 지도 팝업까지 채운 표를 만듭니다."""
+    from common.pois import attach_popups, load_pois
+    from common.stations import StationIndex, link_pois, load_stations, station_label
+
+    pois = load_pois()
+    links = link_pois(pois, StationIndex(load_stations()), _ridership_or_none(), k=k)
+
+    # 너무 멀어서 비워 둔 연결은 None으로 둡니다.
+    labels = [
+        station_label(line, name) if pd.notna(name) else None for line, name in zip(links["노선명"], links["역명"])
+    ]
+    totals = links["총승하차"] if "총승하차" in links.columns else [None] * len(links)
+    details = [
+        None if label is None
+        else f"{label} ({km:.2f}km · 승하차 {total:,.0f}명)" if pd.notna(total)
+        else f"{label} ({km:.2f}km)"
+        for label, km, total in zip(labels, links["거리_km"], totals)
+    ]
+
+    # links는 관광지 순서대로 같은 수씩 붙어 있습니다. 역이 k개보다 적으면 역 수만큼입니다.
+    per_poi = int(links["순위"].max()) if len(links) else k
+    pois["subway"] = [label or NO_STATION for label in labels[::per_poi]]
+    pois["nearby"] = [
+        " / ".join(detail for detail in details[i:i + per_poi] if detail) or NO_STATION
+        for i in range(0, len(details), per_poi)
+    ]
+    return attach_popups(pois)
+
+
+def poi_table():
+    """지도에 올릴 관광지 표 (02 페이지). 관광지·역·승하차 파일 중 하나라도 바뀌면 다시 만듭니다."""
+    from common.pois import POI_FILE
+    from common.stations import STATIONS_FILE
+
+    version = artifact_version(file_version(POI_FILE), file_version(STATIONS_FILE), file_version(SUBWAY_FILE))
+    tag = build_tag(
+        "common.artifacts", "common.data", "common.pois", "common.stations", "common.subway", k=NEAREST_STATIONS
+    )
+    return cached_artifact("poi_table", tag, version, build_poi_table)
@@ -0,0 +1,188 @@
+"""순위 막대 그래프에서 같이 쓰는 색상 계산 도우미와 그래프 캐시입니다."""
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.colors import sequential
+
+from common import perf
+
+# 0~255 단계의 파란색 문자열을 미리 만들어 두고 인덱스로만 꺼내 씁니다.
+_BLUE_FADE_LUT = np.array([f"rgb(0,0,{b})" for b in range(256)], dtype=object)
+_BLUES_R = np.array(sequential.Blues_r, dtype=object)
+
+
+def _blue_fade(n, n_top):
+    # 지하철 페이지: i번째 역은 파란색을 (1 - i/n) 만큼 어둡게
+    levels = (255 * (1 - np.arange(n) / n)).astype(int)
+    return _BLUE_FADE_LUT[levels]
+
+
+def _blues(n, n_top):
+    # 가축 페이지: 1등이 아닌 막대들에 Blues_r 팔레트를 차례대로 나눠 줌
+    colors = np.empty(n, dtype=_BLUES_R.dtype)
+    rest = n - n_top
+    if rest > 0:
+        positions = np.arange(rest) / rest * (len(_BLUES_R) - 1)
+        colors[n_top:] = _BLUES_R[positions.astype(int)]
+    return colors
+
+
+# 팔레트 이름: (1등 색, 나머지 색을 만드는 함수)
+PALETTES = {
+    "blue_fade": ("rgb(255,0,0)", _blue_fade),
+    "blues": ("#FF0000", _blues),
+}
+
+
+@lru_cache(maxsize=256)
+def _ramp(n, n_top, palette):
+    top_color, make_rest = PALETTES[palette]
+    colors = make_rest(n, n_top)
+    colors[:n_top] = top_color
+    colors.setflags(write=False)
+    return colors
+
+
+def rank_colors(values, palette="blues"):
+    """내림차순으로 정렬된 값 배열을 받아 막대 색 배열을 돌려줍니다.
+
+    최댓값과 같은(공동 1등) 막대는 빨간색, 나머지는 팔레트의 그라데이션입니다.
+    색 배열은 (길이, 공동 1등 수, 팔레트)마다 한 번만 만들어 재사용합니다.
+    """
+    values = np.asarray(values)
+    n = len(values)
+    if n == 0:
+        return _BLUE_FADE_LUT[:0]
+    n_top = int((values == values[0]).sum())
+    return _ramp(n, n_top, palette)
+
+
+def station_ranking_chart(stations, date, line, others=(0, 0)):
+    """지하철 페이지의 역별 승·하차 막대 그래프입니다. stations는 총승하차 내림차순으로 정렬돼 있어야 합니다.
+
+    others가 (역 수, 합계)로 주어지면 마지막에 회색 '기타' 막대를 하나 더 그립니다.
+    """
+    # plotly.express는 불러오는 데만 수백 ms가 걸려서, 그래프 캐시가 비었을 때만 불러옵니다.
+    import plotly.express as px
+
+    # 색상 설정: 1등은 빨간색, 나머지는 파란색 그라데이션
+    colors = list(rank_colors(stations["총승하차"].to_numpy(), palette="blue_fade"))
+
+    n_others, others_total = others
+    if n_others:
+        stations = pd.concat(
+            [stations[["역명", "총승하차"]], pd.DataFrame({"역명": [f"기타 {n_others}개 역"], "총승하차": [others_total]})],
+            ignore_index=True,
+        )
+        colors.append("lightgray")
+
+    # Plotly 그래프
+    fig = px.bar(
+        stations,
+        x="역명",
+        y="총승하차",
+        title=f"{date} · {line} 승·하차 TOP 역",
+    )
+
+    # 색 적용
+    fig.update_traces(marker_color=colors)
+
+    fig.update_layout(
+        xaxis_title="역명",
+        yaxis_title="승·하차 총합",
+        title_font_size=22,
+        template="plotly_white",
+    )
+    return fig
+
+
+def daily_series_chart(dates, series, weekend, title):
+    """한 달 보기의 일별 추이 선 그래프입니다. series는 {이름: 일별 값 배열}이고 주말은 회색 띠로 표시합니다."""
+    x = pd.to_datetime(dates, format="%Y%m%d")
+    fig = go.Figure()
+    for name, values in series.items():
+        fig.add_trace(go.Scatter(x=x, y=values, mode="lines+markers", name=name))
+
+    for day in x[weekend]:
+        fig.add_vrect(
+            x0=day - pd.Timedelta(hours=12),
+            x1=day + pd.Timedelta(hours=12),
+            fillcolor="lightgray",
+            opacity=0.3,
+            line_width=0,
+        )
+
+    fig.update_layout(
+        title=title,
+        xaxis_title="날짜",
+        yaxis_title="승·하차 총합",
+        title_font_size=22,
+        template="plotly_white",
+        hovermode="x unified",
+    )
+    return fig
+
+
+def weekday_weekend_chart(names, weekday, weekend, title):
+    """역별 평일/주말 하루 평균 승·하차를 나란히 놓은 막대 그래프입니다."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=names, y=weekday, name="평일 평균", marker_color="#1f77b4"))
+    fig.add_trace(go.Bar(x=names, y=weekend, name="주말 평균", marker_color="#FF0000"))
+    fig.update_layout(
+        title=title,
+        barmode="group",
+        xaxis_title="역명",
+        yaxis_title="하루 평균 승·하차",
+        title_font_size=22,
+        template="plotly_white",
+    )
+    return fig
+
+
+class FigureCache:
+    """완성된 Plotly 그래프(go.Figure 객체)를 그대로 저장해 두는 크기 제한 LRU 캐시입니다.
+
+    키에는 데이터 버전과 필터 선택값(연도·날짜·호선 등)을 넣습니다.
+    같은 선택을 다시 보면 pandas 집계와 그래프 생성을 모두 건너뛰고, 저장된 객체를 그대로 돌려줍니다.
+    돌려받은 그래프는 모든 세션이 같이 쓰는 객체이므로 읽기 전용으로만 씁니다.
+    (st.plotly_chart에 넘기기만 하고, 고쳐야 하면 build() 안에서 고침)
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        """key에 해당하는 그래프를 돌려줍니다. 없으면 build()로 만들고 저장합니다."""
+        with self._lock:
+            fig = self._items.get(key)
+            if fig is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+
+        perf.cache_event("figure_cache", hit=fig is not None)
+        if fig is None:
+            fig = build()
+            with self._lock:
+                self.misses += 1
+                self._items[key] = fig
+                self._items.move_to_end(key)
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+# 프로세스 안의 모든 세션이 같이 쓰는 그래프 캐시
+FIGURE_CACHE = FigureCache()
@@ -0,0 +1,190 @@
+"""가축 데이터의 (품종, 시도, 시군, 연도) 롤업 큐브입니다.
+
+원본 행을 시군 단위로 한 번 합쳐 두고, 상위 단계(시도·품종·전국)는 이 큐브에서 다시 합칩니다.
+CSV 끝에 새 연도 행이 덧붙여지면 늘어난 부분만 읽어서 해당 연도만 다시 집계합니다.
+
+저장 파일 이름과 메타에는 큐브 형식 태그(이 모듈과 common.livestock의 소스 해시, CUBE_FORMAT)가 들어갑니다.
+MEASURE_COLS·CUBE_KEYS·전처리가 바뀌면 태그가 달라지므로, 예전 모양의 큐브에 행을 덧붙이지 않고 처음부터 다시 만듭니다.
+"""
+import io
+import json
+
+import pandas as pd
+
+from common.data import (
+    CACHE_DIR,
+    DEFAULT_ENCODINGS,
+    atomic_write_text,
+    code_version,
+    file_hash,
+    file_version,
+    read_arrow,
+    resolve_path,
+    write_arrow,
+)
+from common.livestock import DATA_FILE, MEASURE_COLS, load_livestock, prepare_livestock
+
+CUBE_KEYS = ['Species', 'Sido', 'Sigungu', 'Year']
+
+# 큐브 저장 형식. 저장 방식을 바꾸면 올려서 저장된 큐브를 모두 새로 만들게 합니다.
+CUBE_FORMAT = 1
+
+# True면 저장된 큐브를 무시하고 다시 만듭니다. (python -m common.precompute --force)
+FORCE = False
+
+# 드릴다운 단계별 그룹 키 (가장 거친 단계 → 가장 자세한 단계)
+LEVELS = {
+    'national': ['Year'],
+    'species': ['Species', 'Year'],
+    'sido': ['Species', 'Sido', 'Year'],
+    'sigungu': CUBE_KEYS,
+}
+
+
+def _aggregate(df, keys):
+    # 원본은 값 범위에 맞는 작은 정수 타입(SCHEMA)으로 압축돼 있으므로 합계가 넘치지 않게 int64로 더합니다.
+    measures = df[keys + MEASURE_COLS].astype({col: 'int64' for col in MEASURE_COLS})
+    return measures.groupby(keys, as_index=False, sort=False, observed=True)[MEASURE_COLS].sum()
+
+
+def _with_deltas(level_df, keys):
+    """바로 이전 기록 연도 대비 증감 컬럼(`*_YoY`)을 붙입니다. 첫 연도는 비어 있습니다."""
+    level_df = level_df.sort_values('Year', kind='stable', ignore_index=True)
+    group_keys = [k for k in keys if k != 'Year']
+    if group_keys:
+        deltas = level_df.groupby(group_keys, sort=False)[MEASURE_COLS].diff()
+    else:
+        deltas = level_df[MEASURE_COLS].diff()
+    return pd.concat([level_df, deltas.add_suffix('_YoY')], axis=1)
+
+
+class LivestockCube:
+    """시군 단위 기본 큐브와 단계별 롤업(연도별 증감 포함)을 들고 있는 객체입니다."""
+
+    def __init__(self, base, n_rows):
+        self.base = base.sort_values('Year', kind='stable', ignore_index=True)
+        self.n_rows = n_rows
+        self._sums = {}
+        self._levels = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls(_aggregate(df, CUBE_KEYS), len(df))
+
+    @property
+    def years(self):
+        return sorted(self.base['Year'].unique())
+
+    def level(self, name):
+        """단계 이름('national', 'species', 'sido', 'sigungu')의 롤업을 돌려줍니다."""
+        if name not in self._levels:
+            keys = LEVELS[name]
+            if name not in self._sums:
+                self._sums[name] = self.base if name == 'sigungu' else _aggregate(self.base, keys)
+            self._levels[name] = _with_deltas(self._sums[name], keys)
+        return self._levels[name]
+
+    def append(self, new_rows):
+        """새로 추가된 원본 행을 반영합니다. 새 행이 들어온 연도만 다시 집계합니다."""
+        if new_rows.empty:
+            return
+        years = new_rows['Year'].unique()
+        self.n_rows += len(new_rows)
+
+        touched = self.base['Year'].isin(years)
+        merged = _aggregate(pd.concat([self.base[touched], new_rows[CUBE_KEYS + MEASURE_COLS]]), CUBE_KEYS)
+        self.base = pd.concat([self.base[~touched], merged]).sort_values('Year', kind='stable', ignore_index=True)
+
+        # 이미 계산해 둔 상위 단계 합계도 해당 연도만 바꿔 끼웁니다. 증감은 다음 조회 때 다시 계산합니다.
+        for name, sums in list(self._sums.items()):
+            if name == 'sigungu':
+                self._sums[name] = self.base
+                continue
+            kept = sums[~sums['Year'].isin(years)]
+            self._sums[name] = pd.concat([kept, _aggregate(merged, LEVELS[name])], ignore_index=True)
+        self._levels.clear()
+
+
+def cube_tag():
+    """큐브를 만드는 코드(이 모듈, 전처리)가 바뀌면 달라지는 짧은 문자열입니다."""
+    return code_version('common.cube', 'common.livestock', cube_format=CUBE_FORMAT)
+
+
+def _cube_paths(file_path, tag):
+    stem = resolve_path(file_path).stem
+    return CACHE_DIR / f'{stem}.cube.{tag}.arrow', CACHE_DIR / f'{stem}.cube.{tag}.json'
+
+
+def read_appended_rows(file_path, offset, encodings=DEFAULT_ENCODINGS):
+    """CSV에서 offset 바이트 이후에 덧붙여진 행만 읽어 전처리합니다."""
+    with open(resolve_path(file_path), 'rb') as f:
+        header = f.readline()
+        f.seek(offset)
+        data = header + f.read()
+
+    for encoding in encodings:
+        try:
+            text = data.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise UnicodeDecodeError(encodings[-1], data, 0, len(data), '지원하는 인코딩으로 읽을 수 없습니다.')
+
+    return prepare_livestock(pd.read_csv(io.StringIO(text)))
+
+
+def save_cube(cube, file_path, version):
+    path = resolve_path(file_path)
+    tag = cube_tag()
+    cube_path, meta_path = _cube_paths(path, tag)
+    size = path.stat().st_size
+    with open(path, 'rb') as f:
+        f.seek(max(size - 1, 0))
+        ends_with_newline = f.read(1) == b'\n'
+
+    write_arrow(cube.base, cube_path)
+    meta = {'format': tag, 'hash': version, 'size': size, 'n_rows': cube.n_rows, 'ends_with_newline': ends_with_newline}
+    atomic_write_text(meta_path, json.dumps(meta))
+
+    # 형식 태그가 다른 예전 큐브 파일은 지웁니다.
+    for old in CACHE_DIR.glob(f'{path.stem}.cube.*'):
+        if old not in (cube_path, meta_path):
+            old.unlink(missing_ok=True)
+
+
+def load_cube(file_path=DATA_FILE):
+    """저장된 큐브를 불러옵니다.
+
+    - 원본이 그대로면 저장된 큐브를 그대로 씁니다.
+    - 원본 끝에 행만 덧붙여졌으면 늘어난 부분만 읽어 큐브를 갱신합니다.
+    - 그 밖의 변경이나 큐브 형식 태그가 다르면(FORCE 포함) 전체를 다시 만듭니다.
+    """
+    path = resolve_path(file_path)
+    tag = cube_tag()
+    cube_path, meta_path = _cube_paths(path, tag)
+    version = file_version(path)
+
+    try:
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        meta = {}
+
+    if meta.get('format') == tag and cube_path.exists() and not FORCE:
+        if meta['hash'] == version:
+            return LivestockCube(read_arrow(cube_path), meta['n_rows'])
+
+        appended = (
+            meta['ends_with_newline']
+            and path.stat().st_size > meta['size']
+            and file_hash(path, meta['size']) == meta['hash']
+        )
+        if appended:
+            cube = LivestockCube(read_arrow(cube_path), meta['n_rows'])
+            cube.append(read_appended_rows(path, meta['size']))
+            save_cube(cube, path, version)
+            return cube
+
+    cube = LivestockCube.from_frame(load_livestock(path))
+    save_cube(cube, path, version)
+    return cube
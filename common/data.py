@@ -0,0 +1,244 @@
+"""CSV를 한 번만 파싱해 컬럼형(Arrow IPC) 파일로 저장하고, 이후에는 메모리 맵으로 여는 공용 데이터 계층입니다."""
+import codecs
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from common.paths import (  # noqa: F401
+    CACHE_DIR,
+    ROOT_DIR,
+    atomic_write_text,
+    code_version,
+    file_hash,
+    file_version,
+    resolve_path,
+)
+
+DEFAULT_ENCODINGS = ("utf-8", "cp949", "euc-kr")
+
+# 이 크기 이상인 CSV는 한 번에 읽지 않고 조각(chunk) 단위로 읽습니다.
+CHUNKED_MIN_BYTES = 64 * 1024 * 1024
+DEFAULT_CHUNKSIZE = 200_000
+
+
+def read_csv_any(file_path, encodings=DEFAULT_ENCODINGS, **kwargs):
+    """주어진 인코딩을 차례대로 시도하며 CSV를 읽습니다."""
+    path = resolve_path(file_path)
+    last_error = None
+    for encoding in encodings:
+        try:
+            return pd.read_csv(path, encoding=encoding, **kwargs)
+        except UnicodeDecodeError as e:
+            last_error = e
+    raise last_error
+
+
+def detect_encoding(file_path, encodings=DEFAULT_ENCODINGS):
+    """파일을 조금씩 디코딩해 보면서 처음으로 성공하는 인코딩을 찾습니다. (메모리는 블록 크기만큼만 씁니다)"""
+    path = resolve_path(file_path)
+    for encoding in encodings:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    decoder.decode(block)
+                decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    raise ValueError(f"지원하는 인코딩({', '.join(encodings)})으로 읽을 수 없습니다: {path}")
+
+
+def compact_frame(df, categorical=(), int32=()):
+    """반복되는 문자열 컬럼은 category로, 정수 컬럼은 int32로 바꿔 메모리를 줄입니다."""
+    return apply_schema(df, {**{col: "category" for col in categorical}, **{col: "int32" for col in int32}})
+
+
+# 'int' 스키마 컬럼이 고를 수 있는 정수 타입 (작은 것부터)
+_INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def smallest_int(values):
+    """값 범위를 담을 수 있는 가장 작은 부호 있는 정수 타입입니다."""
+    if len(values) == 0:
+        return np.dtype(np.int8)
+    low, high = int(values.min()), int(values.max())
+    for dtype in _INT_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def apply_schema(df, schema):
+    """선언된 스키마대로 컬럼 타입을 바꿉니다.
+
+    스키마 값은 'category', 'int'(값 범위에 맞는 가장 작은 정수 타입), 또는 'int16' 같은 고정 타입입니다.
+    'int' 컬럼을 더하거나 집계할 때는 int64로 바꾼 뒤 계산해야 합니다. (조각마다 타입이 다를 수 있고,
+    이어 붙이면 pandas가 더 큰 쪽으로 맞춤)
+    """
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        if dtype == "int":
+            dtype = smallest_int(df[col].to_numpy())
+        df[col] = df[col].astype(dtype)
+    return df
+
+
+def schema_tag(schema):
+    """스키마가 바뀌면 달라지는 짧은 문자열입니다. (컬럼형 파일 이름에 넣어 예전 타입의 파일을 다시 쓰지 않게 함)"""
+    return hashlib.sha1(json.dumps(schema, sort_keys=True).encode()).hexdigest()[:8]
+
+
+def frame_nbytes(df):
+    """DataFrame이 실제로 차지하는 메모리(문자열·범주 포함) 바이트 수입니다."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def concat_compact(frames):
+    """category 컬럼의 범주를 합쳐 가면서 조각들을 이어 붙입니다. (object로 풀리지 않게)
+
+    합친 범주는 정렬해서, 한 번에 읽어 category로 바꾼 결과와 범주 순서(= groupby 결과 순서)가 같게 합니다.
+    """
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return pd.DataFrame()
+    first = frames[0]
+    categorical = [col for col in first.columns if isinstance(first[col].dtype, pd.CategoricalDtype)]
+    merged = {
+        col: union_categoricals([frame[col] for frame in frames], sort_categories=not first[col].cat.ordered)
+        for col in categorical
+    }
+    result = pd.concat([frame.drop(columns=categorical) for frame in frames], ignore_index=True)
+    for col in categorical:
+        result[col] = merged[col]
+    return result[first.columns]
+
+
+def stream_csv(
+    file_path,
+    prepare=None,
+    compact=None,
+    row_filter=None,
+    group_by=None,
+    measures=None,
+    chunksize=DEFAULT_CHUNKSIZE,
+    encodings=DEFAULT_ENCODINGS,
+):
+    """CSV를 chunksize 행씩 읽어 조각마다 전처리·압축·필터·집계를 한 뒤 합칩니다.
+
+    - prepare: 조각마다 적용할 전처리 함수 (예: 컬럼명 정리)
+    - compact: 조각마다 적용할 dtype 압축 함수 (예: category/int32 변환)
+    - row_filter: 남길 행을 고르는 함수 (불리언 마스크를 돌려줌)
+    - group_by: 주면 조각마다 이 키로 합계를 내고, 마지막에 부분 합계끼리 다시 합칩니다.
+      이 경우 메모리에는 원본 전체가 아니라 집계 결과만 남습니다.
+    - measures: group_by로 더할 컬럼 (주지 않으면 숫자 컬럼 전부)
+    """
+    encoding = detect_encoding(file_path, encodings)
+    parts = []
+    with pd.read_csv(resolve_path(file_path), encoding=encoding, chunksize=chunksize) as reader:
+        for chunk in reader:
+            if prepare is not None:
+                chunk = prepare(chunk)
+            if row_filter is not None:
+                chunk = chunk[row_filter(chunk)]
+            if compact is not None:
+                chunk = compact(chunk)
+            if group_by is not None:
+                chunk = _partial_sum(chunk, group_by, measures)
+            parts.append(chunk)
+
+    result = concat_compact(parts)
+    if group_by is not None and len(result):
+        result = _partial_sum(result, group_by, measures)
+    return result
+
+
+def _partial_sum(df, group_by, measures=None):
+    if measures is None:
+        measures = [col for col in df.select_dtypes("number").columns if col not in group_by]
+    # 부분 합계를 더하다가 int32 범위를 넘지 않도록 int64로 더합니다.
+    return (
+        df.astype({col: "int64" for col in measures})
+        .groupby(group_by, as_index=False, observed=True, sort=False)[measures]
+        .sum()
+    )
+
+
+def _func_tag(func):
+    # 스키마를 선언한 함수(func.schema)는 스키마가 바뀌면 이름이 달라집니다.
+    schema = getattr(func, "schema", None)
+    return func.__name__ if schema is None else f"{func.__name__}-{schema_tag(schema)}"
+
+
+def _columnar_prefix(file_path, prepare=None, compact=None):
+    names = [_func_tag(func) for func in (prepare, compact) if func is not None] or ["raw"]
+    return f"{resolve_path(file_path).stem}.{'+'.join(names)}."
+
+
+def columnar_path(file_path, version, prepare=None, compact=None):
+    """변환된 컬럼형 파일이 저장될 경로입니다. 원본 버전과 전처리 함수 이름이 파일명에 들어갑니다."""
+    return CACHE_DIR / f"{_columnar_prefix(file_path, prepare, compact)}{version[:16]}.arrow"
+
+
+def build_columnar(file_path, prepare=None, encodings=DEFAULT_ENCODINGS, compact=None, chunksize=None):
+    """CSV를 파싱하고(필요하면 전처리까지) Arrow IPC 파일로 저장한 뒤 그 경로를 돌려줍니다.
+
+    chunksize를 주거나 파일이 CHUNKED_MIN_BYTES보다 크면 조각 단위로 읽어서,
+    object 타입의 전체 프레임이 한꺼번에 메모리에 올라오지 않게 합니다.
+    다만 전체 행을 담는 캐시이므로 압축된 조각들은 마지막에 모두 합칩니다. 집계 결과만 필요하면
+    stream_csv에 group_by를 주어(stream_livestock, stream_subway) 합계만 메모리에 남기세요.
+    """
+    version = file_version(file_path)
+    target = columnar_path(file_path, version, prepare, compact)
+    if target.exists():
+        return target
+
+    if chunksize is None and resolve_path(file_path).stat().st_size >= CHUNKED_MIN_BYTES:
+        chunksize = DEFAULT_CHUNKSIZE
+
+    if chunksize:
+        df = stream_csv(file_path, prepare=prepare, compact=compact, chunksize=chunksize, encodings=encodings)
+    else:
+        df = read_csv_any(file_path, encodings)
+        if prepare is not None:
+            df = prepare(df)
+        if compact is not None:
+            df = compact(df)
+
+    write_arrow(df, target)
+
+    # 이전 버전의 변환 파일은 지웁니다.
+    for old in target.parent.glob(f"{_columnar_prefix(file_path, prepare, compact)}*.arrow"):
+        if old != target:
+            old.unlink(missing_ok=True)
+    return target
+
+
+def write_arrow(df, path):
+    """DataFrame을 메모리 맵으로 열 수 있는 비압축 Arrow IPC 파일로 저장합니다.
+
+    여러 워커가 동시에 변환해도 깨진 파일이 보이지 않도록 임시 파일에 쓰고 교체합니다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+
+def read_arrow(path):
+    """Arrow IPC 파일을 메모리 맵으로 열어 DataFrame으로 돌려줍니다."""
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def load_frame(file_path, prepare=None, encodings=DEFAULT_ENCODINGS, compact=None, chunksize=None):
+    """컬럼형 파일을 메모리 맵으로 열어 DataFrame으로 돌려줍니다. 없으면 먼저 만들어 둡니다."""
+    return read_arrow(build_columnar(file_path, prepare, encodings, compact, chunksize))
@@ -0,0 +1,89 @@
+"""농가 규모 분포 분석: 대규모 농가 집중도, 구간별 평균 사육 두수, 지니 계수, HHI.
+
+(행 × 규모 구간) 호수·두수 행렬을 한 번에 그룹별로 더한 뒤, 모든 지표를 그 행렬에서 NumPy 연산으로 계산합니다.
+구간 안의 농가는 모두 그 구간 평균 두수를 기른다고 보고 지니 계수와 HHI를 근사합니다.
+"""
+import numpy as np
+import pandas as pd
+
+from common.livestock import SIZE_BUCKETS, SIZE_FARMS_COLS, SIZE_HEADS_COLS
+
+# 기본 집계 단위와 '대규모 농가'로 보는 구간 (1,000두 이상)
+DIST_KEYS = ['Species', 'Sido', 'Year']
+LARGE_BUCKETS = ['5k_up', '5k_2k', '2k_1k']
+AVG_COLS = [f'{bucket}_Avg' for bucket in SIZE_BUCKETS]
+
+# 전국 합계 행의 Sido 값
+NATIONAL = '전국'
+
+
+def _group_sums(df, keys):
+    """keys별로 (그룹 × 구간) 호수·두수 행렬을 더합니다. 정렬 한 번 + np.add.reduceat 한 번씩입니다."""
+    codes = [pd.factorize(df[key], sort=True) for key in keys]
+    group_ids = np.ravel_multi_index([c for c, _ in codes], [len(u) for _, u in codes])
+    order = np.argsort(group_ids, kind='stable')
+    sorted_ids = group_ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]]) if len(order) else np.array([], dtype=int)
+
+    farms = df[SIZE_FARMS_COLS].to_numpy(dtype=np.int64)[order]
+    heads = df[SIZE_HEADS_COLS].to_numpy(dtype=np.int64)[order]
+    if len(order):
+        farms = np.add.reduceat(farms, starts, axis=0)
+        heads = np.add.reduceat(heads, starts, axis=0)
+
+    first = order[starts]
+    groups = pd.DataFrame({key: np.asarray(df[key])[first] for key in keys})
+    return groups, farms, heads
+
+
+def _metrics(farms, heads):
+    """(그룹 × 구간) 행렬에서 모든 지표를 한 번에 계산합니다."""
+    total_farms = farms.sum(axis=1)
+    total_heads = heads.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = np.where(farms > 0, heads / farms, np.nan)
+
+        large = [SIZE_BUCKETS.index(bucket) for bucket in LARGE_BUCKETS]
+        large_share = heads[:, large].sum(axis=1) / total_heads
+
+        # 로렌츠 곡선: 작은 구간부터 누적한 농가 비율(x)과 두수 비율(y)
+        cum_farms = np.cumsum(farms[:, ::-1], axis=1) / total_farms[:, None]
+        cum_heads = np.cumsum(heads[:, ::-1], axis=1) / total_heads[:, None]
+        prev_farms = np.pad(cum_farms[:, :-1], ((0, 0), (1, 0)))
+        prev_heads = np.pad(cum_heads[:, :-1], ((0, 0), (1, 0)))
+        gini = 1 - ((cum_farms - prev_farms) * (cum_heads + prev_heads)).sum(axis=1)
+
+        # HHI = Σ(농가별 점유율)² = Σ 구간 두수² / (구간 호수 × 전체 두수²), 0~10,000
+        hhi = np.where(farms > 0, heads.astype(float) ** 2 / farms, 0).sum(axis=1) / total_heads.astype(float) ** 2 * 10_000
+
+    return total_farms, total_heads, avg, large_share, gini, hhi
+
+
+def size_distribution(df):
+    """품종·시도·연도별 (그리고 품종·연도별 전국) 농가 규모 분포 지표 표입니다.
+
+    컬럼: Species, Sido, Year, Farms, Heads, Large_Share(1,000두 이상 농가의 두수 비율),
+    Gini, HHI, 구간별 평균 두수(`*_Avg`). 농가가 없는 구간의 평균과 두수가 0인 그룹의 비율 지표는 비어 있습니다.
+    """
+    groups, farms, heads = _group_sums(df, DIST_KEYS)
+
+    # 전국 = 시도 행렬을 (품종, 연도)로 한 번 더 더한 것
+    national, national_farms, national_heads = _group_sums(
+        pd.concat([groups, pd.DataFrame(farms, columns=SIZE_FARMS_COLS), pd.DataFrame(heads, columns=SIZE_HEADS_COLS)], axis=1),
+        ['Species', 'Year'],
+    )
+    national.insert(1, 'Sido', NATIONAL)
+
+    groups = pd.concat([national, groups.astype({'Sido': str})], ignore_index=True)
+    farms = np.vstack([national_farms, farms])
+    heads = np.vstack([national_heads, heads])
+
+    total_farms, total_heads, avg, large_share, gini, hhi = _metrics(farms, heads)
+    result = groups.assign(
+        Farms=total_farms,
+        Heads=total_heads,
+        Large_Share=large_share,
+        Gini=gini,
+        HHI=hhi,
+    )
+    return pd.concat([result, pd.DataFrame(avg, columns=AVG_COLS)], axis=1)
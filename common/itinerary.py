@@ -0,0 +1,145 @@
+"""관광지 여행 일정 엔진: 위치로 날짜를 나누고, 날짜마다 이동 순서를 정합니다.
+
+1. 하버사인 거리 행렬을 한 번 계산합니다.
+2. 위경도로 days개 묶음을 만듭니다. (하루 방문 수가 고르게 되도록 용량 제한이 있는 k-means)
+3. 묶음마다 최근접 이웃으로 경로를 만들고 2-opt로 다듬습니다.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_matrix(lats, lons):
+    """모든 지점 쌍 사이의 하버사인 거리(km) 행렬입니다."""
+    lat = np.radians(np.asarray(lats, dtype=float))
+    lon = np.radians(np.asarray(lons, dtype=float))
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _balanced_clusters(points, k, iterations=20):
+    """하루 방문 수가 ceil(n/k)를 넘지 않도록 묶는 k-means입니다."""
+    n = len(points)
+    capacity = math.ceil(n / k)
+
+    # 초기 중심: 가장 먼 점을 차례로 고르는 방식 (결과가 항상 같도록 난수 없이)
+    centers = [points.mean(axis=0)]
+    for _ in range(k):
+        dist = np.min(((points[:, None, :] - np.array(centers)[None, :, :]) ** 2).sum(axis=2), axis=1)
+        centers.append(points[int(np.argmax(dist))])
+    centers = np.array(centers[1:])
+
+    labels = np.full(n, -1)
+    for _ in range(iterations):
+        dist = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        # 가장 가까운 묶음과 두 번째 묶음의 거리 차이(놓치면 손해가 큰 정도)가 큰 지점부터,
+        # 용량이 남은 묶음 중 가장 가까운 곳에 배정합니다.
+        ranked = np.sort(dist, axis=1)
+        regret = ranked[:, 1] - ranked[:, 0] if k > 1 else np.zeros(n)
+        new_labels = np.full(n, -1)
+        counts = np.zeros(k, dtype=int)
+        for point in np.argsort(-regret, kind="stable"):
+            for cluster in np.argsort(dist[point], kind="stable"):
+                if counts[cluster] < capacity:
+                    new_labels[point] = cluster
+                    counts[cluster] += 1
+                    break
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        centers = np.array([points[labels == c].mean(axis=0) if counts[c] else centers[c] for c in range(k)])
+    return labels
+
+
+def _nearest_neighbour(dist, start=0):
+    n = len(dist)
+    route = [start]
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, dist[route[-1]])
+        nxt = int(np.argmin(row))
+        route.append(nxt)
+        visited[nxt] = True
+    return np.array(route)
+
+
+def _two_opt(route, dist, max_rounds=50):
+    """열린 경로(출발지로 돌아오지 않음)에 대한 2-opt. 한 i에 대해 모든 j의 이득을 한 번에 계산합니다."""
+    route = route.copy()
+    n = len(route)
+    if n < 4:
+        return route
+    for _ in range(max_rounds):
+        improved = False
+        for i in range(1, n - 1):
+            a = route[i - 1]
+            b = route[i]
+            js = np.arange(i + 1, n)
+            c = route[js]
+            # 구간 [i, j]를 뒤집으면 a-b, c-d 간선이 a-c, b-d로 바뀝니다. (j가 끝이면 d 없음)
+            d = route[np.minimum(js + 1, n - 1)]
+            has_next = js + 1 < n
+            gain = (dist[a, b] + np.where(has_next, dist[c, d], 0.0)) - (
+                dist[a, c] + np.where(has_next, dist[b, d], 0.0)
+            )
+            best = int(np.argmax(gain))
+            if gain[best] > 1e-9:
+                j = int(js[best])
+                route[i:j + 1] = route[i:j + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    return route
+
+
+def route_length(route, dist):
+    """경로를 따라 이동한 총 거리(km)입니다."""
+    route = np.asarray(route)
+    if len(route) < 2:
+        return 0.0
+    return float(dist[route[:-1], route[1:]].sum())
+
+
+@lru_cache(maxsize=64)
+def _plan(coords, days):
+    points = np.array(coords, dtype=float)
+    n = len(points)
+    days = max(1, min(days, n))
+    dist = haversine_matrix(points[:, 0], points[:, 1])
+
+    # 경도·위도 스케일을 맞춘 평면 좌표로 묶음을 나눕니다.
+    scale = math.cos(math.radians(points[:, 0].mean()))
+    labels = _balanced_clusters(np.column_stack([points[:, 0], points[:, 1] * scale]), days)
+
+    plan = []
+    for cluster in range(days):
+        members = np.flatnonzero(labels == cluster)
+        if len(members) == 0:
+            continue
+        sub = dist[np.ix_(members, members)]
+        # 묶음에서 가장 서쪽 지점에서 출발합니다.
+        start = int(np.argmin(points[members, 1]))
+        order = _two_opt(_nearest_neighbour(sub, start), sub)
+        plan.append((tuple(int(i) for i in members[order]), route_length(order, sub)))
+
+    # 날짜 순서도 서쪽 → 동쪽으로 정렬합니다.
+    plan.sort(key=lambda day: points[list(day[0]), 1].mean())
+    return tuple(plan)
+
+
+def plan_itinerary(locations, days):
+    """locations(dict 목록, lat/lon 포함)를 days일 일정으로 나눕니다.
+
+    반환값: [(그날 방문할 location 목록, 그날 이동 거리 km), ...]
+    같은 (지점 집합, 일수)에 대한 결과는 메모해 두고 재사용합니다.
+    """
+    if not locations:
+        return []
+    coords = tuple((loc["lat"], loc["lon"]) for loc in locations)
+    return [([locations[i] for i in day], km) for day, km in _plan(coords, days)]
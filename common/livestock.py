@@ -0,0 +1,94 @@
+"""가축 사육 현황(dubbongispig.csv) 데이터의 컬럼 정의와 전처리입니다."""
+import pandas as pd
+
+from common.data import DEFAULT_CHUNKSIZE, apply_schema, load_frame, stream_csv
+
+DATA_FILE = "dubbongispig.csv"
+
+# 컬럼명 클리닝
+COLUMN_MAPPING = {
+    '순번': 'ID', '품종': 'Species', '시도': 'Sido', '시군': 'Sigungu', '년도': 'Year',
+    '전체호수': 'Total_Farms', '전체두수': 'Total_Heads',
+    '5000두 이상(호수)': '5k_up_Farms', '5000두 이상(두수)': '5k_up_Heads',
+    '5000두-2000두 이상(호수)': '5k_2k_Farms', '5000두-2000두 이상(두수)': '5k_2k_Heads',
+    '2000두-1000두 이상(호수)': '2k_1k_Farms', '2000두-1000두 이상(두수)': '2k_1k_Heads',
+    '1000두-500두 이상(호수)': '1k_500_Farms', '1000두-500두 이상(두수)': '1k_500_Heads',
+    '500두-100두 이상(호수)': '500_100_Farms', '500두-100두 이상(두수)': '500_100_Heads',
+    '100두-20두 이상(호수)': '100_20_Farms', '100두-20두 이상(두수)': '100_20_Heads',
+    '20두-0두 이상(호수)': '20_0_Farms', '20두-0두 이상(두수)': '20_0_Heads',
+}
+
+# 규모 구간(큰 농가 → 작은 농가 순)과 집계 대상 숫자 컬럼
+SIZE_BUCKETS = ['5k_up', '5k_2k', '2k_1k', '1k_500', '500_100', '100_20', '20_0']
+SIZE_HEADS_COLS = [f'{bucket}_Heads' for bucket in SIZE_BUCKETS]
+SIZE_FARMS_COLS = [f'{bucket}_Farms' for bucket in SIZE_BUCKETS]
+MEASURE_COLS = ['Total_Farms', 'Total_Heads'] + [
+    f'{bucket}_{kind}' for bucket in SIZE_BUCKETS for kind in ('Farms', 'Heads')
+]
+
+# 저장·캐시용 컬럼 스키마
+# - 반복되는 지역/품종 문자열은 category
+# - 연도는 int16, 순번과 호수·두수는 값 범위에 맞는 가장 작은 정수 타입('int')
+#   (합계를 낼 때는 int64로 바꿔서 계산합니다: cube, sigungu_totals, stream_livestock)
+CATEGORY_COLS = ['Species', 'Sido', 'Sigungu']
+SCHEMA = {
+    **{col: 'category' for col in CATEGORY_COLS},
+    'ID': 'int',
+    'Year': 'int16',
+    **{col: 'int' for col in MEASURE_COLS},
+}
+
+
+def prepare_livestock(df):
+    """컬럼명을 정리하고 숫자 컬럼의 데이터 타입을 변환합니다."""
+    df = df.rename(columns=COLUMN_MAPPING)
+
+    # 데이터 타입 변환
+    numeric_cols = [col for col in df.columns if 'Heads' in col or 'Farms' in col or col in ['ID', 'Year']]
+    for col in numeric_cols:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
+
+    return df
+
+
+def compact_livestock(df):
+    return apply_schema(df, SCHEMA)
+
+
+compact_livestock.schema = SCHEMA
+
+
+def load_livestock(file_path=DATA_FILE):
+    """전처리까지 끝난 가축 데이터를 컬럼형 캐시에서 불러옵니다."""
+    return load_frame(file_path, prepare=prepare_livestock, compact=compact_livestock)
+
+
+def sigungu_totals(df):
+    """연도·시군별 전체 두수 합계입니다. (07 페이지의 시군별 순위 그래프용)"""
+    return (
+        df.astype({'Total_Heads': 'int64'})
+        .groupby(['Year', 'Sigungu'], as_index=False, observed=True)['Total_Heads']
+        .sum()
+    )
+
+
+def stream_livestock(file_path=DATA_FILE, years=None, group_by=None, chunksize=DEFAULT_CHUNKSIZE):
+    """큰 전국·다년도 파일을 조각 단위로 읽습니다.
+
+    years를 주면 그 연도만 남기고, group_by를 주면 읽으면서 바로 합계를 냅니다.
+    (예: group_by=['Sido', 'Year'] → 시도·연도별 합계만 메모리에 남음)
+    시군별 합계 아티팩트(common.artifacts.livestock_sigungu)가 이 방식으로 만들어집니다.
+    """
+    row_filter = None
+    if years is not None:
+        years = list(years)
+        row_filter = lambda chunk: chunk['Year'].isin(years)
+    return stream_csv(
+        file_path,
+        prepare=prepare_livestock,
+        compact=compact_livestock,
+        row_filter=row_filter,
+        group_by=group_by,
+        measures=MEASURE_COLS,
+        chunksize=chunksize,
+    )
@@ -0,0 +1,48 @@
+"""관광지 지도를 만드는 도우미입니다.
+
+기본 지도는 마커 없이 한 번만 그리고, 관광지는 화면에 보이는 것만 클러스터 레이어로 따로 보냅니다.
+st_folium은 feature_group_to_add로 받은 레이어가 바뀌어도 지도를 새로 만들지 않고 레이어만 바꿔 끼웁니다.
+"""
+import folium
+from folium.plugins import FastMarkerCluster
+
+MAP_CENTER = [37.5665, 126.9780]
+MAP_ZOOM = 12
+
+# 화면 하나에 보낼 최대 관광지 수 (데이터가 커져도 전송량이 일정하게 유지되도록)
+# 넘으면 GridIndex.sample로 격자 칸마다 고르게 골라 보냅니다.
+MAX_VIEWPORT_POIS = 2000
+
+# 빨간색 info-sign 마커를 만드는 브라우저 쪽 콜백. row = [lat, lon, popup, name]
+_MARKER_CALLBACK = """
+var callback = function (row) {
+    var icon = L.AwesomeMarkers.icon({markerColor: 'red', icon: 'info-sign', prefix: 'glyphicon', iconColor: 'white'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[2]);
+    marker.bindTooltip(row[3]);
+    return marker;
+};
+"""
+
+
+def popup_html(loc):
+    return f"""
+    <b>{loc['name']}</b><br>
+    {loc['desc']}<br>
+    🚇 {loc['subway']}
+    """
+
+
+def build_base_map(center=MAP_CENTER, zoom=MAP_ZOOM):
+    """마커가 없는 기본 지도입니다. 빈 클러스터 레이어는 클러스터 스크립트/스타일을 불러오기 위한 것입니다."""
+    m = folium.Map(location=center, zoom_start=zoom)
+    FastMarkerCluster([], callback=_MARKER_CALLBACK).add_to(m)
+    return m
+
+
+def cluster_layer(pois):
+    """화면에 보낼 관광지들로 클러스터 레이어를 만듭니다."""
+    rows = pois[["lat", "lon", "popup", "name"]].values.tolist()
+    group = folium.FeatureGroup(name="관광지")
+    FastMarkerCluster(rows, callback=_MARKER_CALLBACK).add_to(group)
+    return group
@@ -0,0 +1,99 @@
+"""MBTI 진로 카탈로그(mbti_careers.json)와 역색인입니다. (pandas 없이 표준 라이브러리만 씁니다)
+
+진로 하나는 {"career", "types", "majors", "personality"} 형태이고,
+유형·학과·MBTI 글자·성격 키워드마다 진로 번호 목록을 미리 만들어 두어 조회할 때 전체를 훑지 않습니다.
+"""
+import json
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+from common.paths import resolve_path
+
+CATALOG_FILE = "mbti_careers.json"
+
+# 네 개의 글자 축 (I/E, S/N, T/F, J/P)
+AXES = (("I", "E"), ("S", "N"), ("T", "F"), ("J", "P"))
+
+MBTI_TYPES = [
+    "ISTJ", "ISFJ", "INFJ", "INTJ",
+    "ISTP", "ISFP", "INFP", "INTP",
+    "ESTP", "ESFP", "ENFP", "ENTP",
+    "ESTJ", "ESFJ", "ENFJ", "ENTJ",
+]
+
+_WORD = re.compile(r"\w+")
+
+
+def keywords(text):
+    """성격 설명을 검색용 단어로 나눕니다. (한글·영문·숫자 단위)"""
+    return _WORD.findall(text.lower())
+
+
+class CareerCatalog:
+    """진로 목록과 역색인(유형, 학과, 글자 축, 성격 키워드 → 진로 번호)입니다."""
+
+    def __init__(self, careers):
+        self.careers = list(careers)
+        self.by_type = defaultdict(list)
+        self.by_major = defaultdict(list)
+        self.by_letter = {letter: set() for axis in AXES for letter in axis}
+        by_keyword = defaultdict(set)
+
+        for i, career in enumerate(self.careers):
+            for mbti in career["types"]:
+                self.by_type[mbti].append(i)
+                for letter in mbti:
+                    self.by_letter[letter].add(i)
+            for major in career["majors"]:
+                self.by_major[major].append(i)
+            for sentence in career["personality"]:
+                for word in keywords(sentence):
+                    by_keyword[word].add(i)
+
+        # 키워드는 정렬해 두고 앞부분 일치(예: '꼼꼼' → '꼼꼼한')를 이진 탐색으로 찾습니다.
+        self._keywords = sorted(by_keyword)
+        self._keyword_ids = [by_keyword[word] for word in self._keywords]
+        self.majors = sorted(self.by_major)
+
+    @classmethod
+    def from_file(cls, file_path=CATALOG_FILE):
+        with open(resolve_path(file_path), encoding="utf-8") as f:
+            return cls(json.load(f)["careers"])
+
+    def __len__(self):
+        return len(self.careers)
+
+    def _items(self, ids):
+        return [self.careers[i] for i in sorted(ids)]
+
+    def for_type(self, mbti):
+        """정확한 유형(예: 'INFJ')에 맞는 진로"""
+        return self._items(self.by_type.get(mbti, []))
+
+    def for_major(self, major):
+        """이 학과를 추천 학과로 가진 진로"""
+        return self._items(self.by_major.get(major, []))
+
+    def for_letters(self, letters):
+        """일부 글자만 정한 유형(예: 'IN', 또는 축마다 None/글자)에 맞는 진로"""
+        chosen = [letter for letter in letters if letter]
+        if not chosen:
+            return list(self.careers)
+        sets = sorted((self.by_letter[letter] for letter in chosen), key=len)
+        return self._items(set.intersection(*sets))
+
+    def search(self, text):
+        """성격 키워드 검색. 단어마다 앞부분이 일치하는 키워드를 찾고, 모든 단어를 만족하는 진로만 남깁니다."""
+        matched = None
+        for word in keywords(text):
+            ids = set()
+            start = bisect_left(self._keywords, word)
+            for pos in range(start, len(self._keywords)):
+                if not self._keywords[pos].startswith(word):
+                    break
+                ids |= self._keyword_ids[pos]
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                return []
+        return [] if matched is None else self._items(matched)
@@ -0,0 +1,88 @@
+"""루트/캐시 폴더 경로, 안전한 파일 쓰기, 데이터 버전과 코드 버전. (pandas 같은 무거운 라이브러리를 불러오지 않습니다)"""
+import hashlib
+import importlib.util
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+# 루트 폴더, 데이터 파일(CSV 등)을 찾는 폴더, 변환 결과를 저장할 캐시 폴더
+# (벤치마크·부하 테스트처럼 따로 떼어 쓰고 싶으면 DUBBONG_DATA_DIR, DUBBONG_CACHE_DIR 환경 변수로 바꿀 수 있습니다)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = Path(os.environ.get("DUBBONG_DATA_DIR", ROOT_DIR))
+CACHE_DIR = Path(os.environ.get("DUBBONG_CACHE_DIR", ROOT_DIR / ".cache"))
+
+
+def resolve_path(file_path):
+    """상대 경로는 데이터 폴더(기본: 루트 폴더) 기준으로 바꿔줍니다."""
+    path = Path(file_path)
+    if not path.is_absolute():
+        path = DATA_DIR / path
+    return path
+
+
+def atomic_write_text(path, text):
+    """임시 파일에 쓴 뒤 교체해서, 다른 워커가 반쯤 쓰인 파일을 읽지 않게 합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def file_hash(file_path, limit=None):
+    """파일 내용의 SHA-1 해시입니다. limit을 주면 앞쪽 limit 바이트만 해시합니다."""
+    h = hashlib.sha1()
+    remaining = limit
+    with open(resolve_path(file_path), "rb") as f:
+        while remaining is None or remaining > 0:
+            size = 1 << 20 if remaining is None else min(1 << 20, remaining)
+            block = f.read(size)
+            if not block:
+                break
+            h.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return h.hexdigest()
+
+
+def file_version(file_path):
+    """파일의 (mtime, 크기, 내용 해시)로 데이터 버전 문자열을 만듭니다.
+
+    mtime과 크기가 이전과 같으면 저장해 둔 해시를 재사용해서 파일 전체를 다시 읽지 않습니다.
+    """
+    path = resolve_path(file_path)
+    stat = path.stat()
+    meta_path = CACHE_DIR / f"{path.name}.meta.json"
+
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        meta = {}
+
+    if meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+        return meta["hash"]
+
+    digest = file_hash(path)
+    meta = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": digest}
+    atomic_write_text(meta_path, json.dumps(meta))
+    return digest
+
+
+@lru_cache(maxsize=None)
+def _module_hash(module):
+    # 모듈을 불러오지 않고 소스 파일만 읽습니다. (folium·scipy 같은 무거운 의존성이 딸려 오지 않음)
+    spec = importlib.util.find_spec(module)
+    with open(spec.origin, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def code_version(*modules, **params):
+    """결과물을 만드는 코드(모듈 소스 파일)와 매개변수로 만든 짧은 버전 문자열입니다.
+
+    캐시 파일 이름에 넣어 두면, 배포로 만드는 코드가 바뀌었을 때 원본 파일이 그대로여도 새로 만듭니다.
+    """
+    h = hashlib.sha1()
+    for module in modules:
+        h.update(_module_hash(module).encode())
+    h.update(json.dumps(params, sort_keys=True).encode())
+    return h.hexdigest()[:8]
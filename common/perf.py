@@ -0,0 +1,316 @@
+"""리런(rerun)마다 단계별 소요 시간과 캐시 적중률을 기록하는 가벼운 계측 도구입니다.
+
+사용법 (페이지 스크립트):
+
+    with perf.rerun("04_지하철분석"):        # 끝나면 기록을 마무리하고 사이드바를 그림 (?debug=1 또는 DUBBONG_PERF=1)
+        with perf.stage("load_index", cache=True):
+            index = load_index(version)  # 캐시된 함수 본문 안에서 perf.mark_miss() 호출
+        ...
+
+프래그먼트는 `with perf.start_rerun("02_관광지#map"):`로 감쌉니다. (사이드바는 그리지 않음)
+st.stop()·st.rerun()이나 오류로 스크립트가 중간에 끝나도 타이머는 with를 빠져나갈 때 마무리됩니다.
+
+DUBBONG_PERF=1 이면 리런 기록을 .cache/perf/reruns.jsonl 에 한 줄씩 쌓고,
+프로세스 누적 통계를 .cache/perf/metrics.{pid}.prom (Prometheus 텍스트 형식)으로 덮어씁니다.
+서버 프로세스마다 파일이 하나씩 생기므로, 수집기(node_exporter textfile 등)는 metrics.*.prom을 모두 읽어야 합니다.
+캐시된 함수가 perf.record_dataset(이름, 바이트)로 알려 준 데이터셋 크기와,
+백그라운드 갱신 스레드(common.refresh)가 perf.record_refresh로 알려 준 마지막 갱신 시간도 함께 보여줍니다.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+from common.paths import CACHE_DIR, atomic_write_text
+
+ENABLED = os.environ.get("DUBBONG_PERF") == "1"
+PERF_DIR = CACHE_DIR / "perf"
+
+# Prometheus 히스토그램 구간(초)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 사이드바 백분위 계산에 쓰는 최근 기록 개수
+RECENT = 500
+
+_local = threading.local()
+_lock = threading.Lock()
+_durations = defaultdict(lambda: deque(maxlen=RECENT))  # (page, stage) → 최근 소요 시간들
+_histograms = {}  # (page, stage) → [구간별 개수..., 합계, 개수]
+_cache_counts = defaultdict(lambda: [0, 0])  # (page, cache 이름) → [적중, 실패]
+_datasets = {}  # 캐시된 데이터셋 이름 → 메모리 바이트 수
+_refreshes = {}  # 갱신 스레드 이름 → [마지막 빌드 시각, 걸린 시간, 성공 수, 실패 수]
+
+
+class RerunTimer:
+    """한 번의 리런 동안의 단계별 시간과 캐시 적중 여부를 모읍니다."""
+
+    def __init__(self, page):
+        self.page = page
+        self.stages = {}
+        self.caches = {}
+        self._start = time.perf_counter()
+        self._active = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.finish()
+
+    @contextmanager
+    def stage(self, name, cache=False):
+        """name 단계의 시간을 잽니다. cache=True면 단계 안에서 mark_miss()가 없었을 때 캐시 적중으로 셉니다."""
+        entry = {"miss": False}
+        self._active.append(entry)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._active.pop()
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            if cache:
+                self.cache_event(name, hit=not entry["miss"])
+
+    def mark_miss(self):
+        if self._active:
+            self._active[-1]["miss"] = True
+
+    def cache_event(self, name, hit):
+        hits, misses = self.caches.get(name, (0, 0))
+        self.caches[name] = (hits + hit, misses + (not hit))
+
+    def finish(self):
+        """리런 기록을 마무리하고 누적 통계에 더합니다. 기록(dict)을 돌려줍니다."""
+        stack = getattr(_local, "stack", [])
+        if self in stack:
+            stack.remove(self)
+
+        self.stages["total"] = time.perf_counter() - self._start
+        record = {
+            "ts": time.time(),
+            "page": self.page,
+            "stages": {name: round(sec, 6) for name, sec in self.stages.items()},
+            "caches": {name: {"hits": h, "misses": m} for name, (h, m) in self.caches.items()},
+        }
+        with _lock:
+            for name, sec in self.stages.items():
+                key = (self.page, name)
+                _durations[key].append(sec)
+                hist = _histograms.setdefault(key, [0] * (len(BUCKETS) + 2))
+                for i, bound in enumerate(BUCKETS):
+                    if sec <= bound:
+                        hist[i] += 1
+                hist[-2] += sec
+                hist[-1] += 1
+            for name, (h, m) in self.caches.items():
+                counts = _cache_counts[(self.page, name)]
+                counts[0] += h
+                counts[1] += m
+
+        if ENABLED:
+            _write(record)
+        return record
+
+
+def start_rerun(page):
+    """이 스레드(= 세션의 스크립트 실행)의 현재 리런 타이머를 시작합니다. 프래그먼트 안에서 중첩해도 됩니다.
+
+    with 문으로 쓰면 빠져나갈 때 finish()를 부릅니다.
+    """
+    timer = RerunTimer(page)
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    _local.stack.append(timer)
+    return timer
+
+
+@contextmanager
+def rerun(page):
+    """페이지 스크립트 전체를 감쌉니다. 어떻게 끝나든 (st.stop, st.rerun, 오류 포함) 기록을 마무리하고 사이드바를 그립니다."""
+    timer = start_rerun(page)
+    try:
+        yield timer
+    finally:
+        timer.finish()
+        render_sidebar(timer)
+
+
+def current():
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+@contextmanager
+def stage(name, cache=False):
+    """현재 리런 타이머의 단계를 잽니다. 타이머가 없으면 아무것도 하지 않습니다."""
+    timer = current()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name, cache=cache):
+        yield
+
+
+def mark_miss():
+    """캐시된 함수 본문에서 호출합니다. (본문이 실행됐다 = 캐시 실패)"""
+    timer = current()
+    if timer is not None:
+        timer.mark_miss()
+
+
+def cache_event(name, hit):
+    """직접 만든 캐시(예: FIGURE_CACHE)의 적중/실패를 현재 리런에 기록합니다."""
+    timer = current()
+    if timer is not None:
+        timer.cache_event(name, hit)
+
+
+def record_dataset(name, nbytes):
+    """캐시에 올린 데이터셋의 메모리 크기를 기록합니다. (캐시된 함수 본문, 즉 새로 만들 때 호출)"""
+    with _lock:
+        _datasets[name] = int(nbytes)
+
+
+def dataset_sizes():
+    """{데이터셋 이름: 바이트 수} (이 프로세스 = 워커 하나 기준)"""
+    with _lock:
+        return dict(_datasets)
+
+
+def record_refresh(name, seconds, failed=False):
+    """백그라운드 갱신 스레드가 데이터셋을 새로 만들 때마다 (걸린 시간, 실패 여부)를 기록합니다."""
+    with _lock:
+        entry = _refreshes.setdefault(name, [0.0, 0.0, 0, 0])
+        entry[0] = time.time()
+        entry[1] = seconds
+        entry[3 if failed else 2] += 1
+
+
+def refresh_stats():
+    """{갱신 스레드 이름: [마지막 빌드 시각, 걸린 시간, 성공 수, 실패 수]}"""
+    with _lock:
+        return {name: list(entry) for name, entry in _refreshes.items()}
+
+
+def percentiles(page, name, qs=(50, 95, 99)):
+    """최근 RECENT번의 기록으로 백분위(초)를 계산합니다."""
+    with _lock:
+        values = sorted(_durations.get((page, name), ()))
+    if not values:
+        return {}
+    return {q: values[min(len(values) - 1, int(len(values) * q / 100))] for q in qs}
+
+
+def cache_hit_rate(page, name):
+    with _lock:
+        hits, misses = _cache_counts.get((page, name), (0, 0))
+    total = hits + misses
+    return hits / total if total else None
+
+
+def prometheus_text():
+    """누적 통계를 Prometheus 텍스트 형식으로 만듭니다."""
+    lines = [
+        "# HELP dubbong_stage_seconds Streamlit 리런 단계별 소요 시간",
+        "# TYPE dubbong_stage_seconds histogram",
+    ]
+    with _lock:
+        for (page, name), hist in sorted(_histograms.items()):
+            labels = f'page="{page}",stage="{name}"'
+            for bound, count in zip(BUCKETS, hist):
+                lines.append(f'dubbong_stage_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'dubbong_stage_seconds_bucket{{{labels},le="+Inf"}} {hist[-1]}')
+            lines.append(f"dubbong_stage_seconds_sum{{{labels}}} {hist[-2]:.6f}")
+            lines.append(f"dubbong_stage_seconds_count{{{labels}}} {hist[-1]}")
+
+        lines += [
+            "# HELP dubbong_cache_requests_total 캐시 조회 수 (result=hit|miss)",
+            "# TYPE dubbong_cache_requests_total counter",
+        ]
+        for (page, name), (hits, misses) in sorted(_cache_counts.items()):
+            labels = f'page="{page}",cache="{name}"'
+            lines.append(f'dubbong_cache_requests_total{{{labels},result="hit"}} {hits}')
+            lines.append(f'dubbong_cache_requests_total{{{labels},result="miss"}} {misses}')
+
+        lines += [
+            "# HELP dubbong_dataset_bytes 캐시된 데이터셋의 메모리 크기",
+            "# TYPE dubbong_dataset_bytes gauge",
+        ]
+        for name, nbytes in sorted(_datasets.items()):
+            lines.append(f'dubbong_dataset_bytes{{dataset="{name}"}} {nbytes}')
+
+        lines += [
+            "# HELP dubbong_refresh_seconds 백그라운드 갱신 스레드의 마지막 빌드 시간",
+            "# TYPE dubbong_refresh_seconds gauge",
+        ]
+        for name, (_, seconds, _, _) in sorted(_refreshes.items()):
+            lines.append(f'dubbong_refresh_seconds{{dataset="{name}"}} {seconds:.6f}')
+        lines += [
+            "# HELP dubbong_refresh_total 백그라운드 갱신 횟수 (result=ok|error)",
+            "# TYPE dubbong_refresh_total counter",
+        ]
+        for name, (_, _, ok, failed) in sorted(_refreshes.items()):
+            lines.append(f'dubbong_refresh_total{{dataset="{name}",result="ok"}} {ok}')
+            lines.append(f'dubbong_refresh_total{{dataset="{name}",result="error"}} {failed}')
+    return "\n".join(lines) + "\n"
+
+
+def _write(record):
+    PERF_DIR.mkdir(parents=True, exist_ok=True)
+    with _lock:
+        with open(PERF_DIR / "reruns.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    atomic_write_text(PERF_DIR / f"metrics.{os.getpid()}.prom", prometheus_text())
+
+
+def render_sidebar(timer):
+    """디버그 모드(?debug=1 또는 DUBBONG_PERF=1)일 때 이번 리런의 단계별 시간과 캐시 적중률을 사이드바에 보여줍니다."""
+    import streamlit as st
+
+    if not (ENABLED or st.query_params.get("debug") == "1"):
+        return
+
+    with st.sidebar.expander(f"⏱️ 성능 ({timer.page})", expanded=True):
+        rows = []
+        for name, sec in timer.stages.items():
+            p = percentiles(timer.page, name)
+            rows.append({
+                "단계": name,
+                "이번(ms)": round(sec * 1000, 2),
+                "p50(ms)": round(p.get(50, 0) * 1000, 2),
+                "p95(ms)": round(p.get(95, 0) * 1000, 2),
+                "p99(ms)": round(p.get(99, 0) * 1000, 2),
+            })
+        st.dataframe(rows, hide_index=True)
+        for name, (hits, misses) in timer.caches.items():
+            rate = cache_hit_rate(timer.page, name)
+            st.caption(
+                f"{name}: 이번 {'적중' if hits else '실패'} · 누적 적중률 {rate:.0%}" if rate is not None else name
+            )
+
+        sizes = dataset_sizes()
+        if sizes:
+            st.caption("캐시된 데이터셋 메모리 (이 워커)")
+            st.dataframe(
+                [{"데이터셋": name, "MiB": round(nbytes / 2**20, 3)} for name, nbytes in sorted(sizes.items())],
+                hide_index=True,
+            )
+
+        refreshes = refresh_stats()
+        if refreshes:
+            st.caption("백그라운드 데이터 갱신 (이 워커)")
+            st.dataframe(
+                [
+                    {
+                        "데이터": name,
+                        "마지막 갱신": time.strftime("%H:%M:%S", time.localtime(ts)),
+                        "빌드(ms)": round(seconds * 1000, 1),
+                        "성공": ok,
+                        "실패": failed,
+                    }
+                    for name, (ts, seconds, ok, failed) in sorted(refreshes.items())
+                ],
+                hide_index=True,
+            )
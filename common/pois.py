@@ -0,0 +1,136 @@
+"""관광지(POI) 데이터 파일과 격자(grid) 공간 인덱스입니다."""
+import math
+
+import numpy as np
+
+from common.data import load_frame
+from common.maps import popup_html
+
+POI_FILE = "seoul_pois.csv"
+
+# 격자 한 칸의 크기(도). 0.01도 ≈ 위도 1.1km
+GRID_CELL_DEG = 0.01
+
+
+def load_pois(file_path=POI_FILE):
+    """관광지 목록 파일(name, lat, lon, desc)을 컬럼형 캐시에서 불러옵니다."""
+    return load_frame(file_path)
+
+
+def attach_popups(pois):
+    """팝업 HTML을 미리 만들어 컬럼으로 넣어 둡니다. (subway 컬럼이 채워진 뒤에 호출)"""
+    pois = pois.copy()
+    pois["popup"] = [popup_html(loc) for loc in pois.to_dict("records")]
+    return pois
+
+
+class GridIndex:
+    """위경도를 GRID_CELL_DEG 크기의 칸으로 나눠, 칸마다 들어 있는 지점 번호를 모아 둔 인덱스입니다.
+
+    화면 영역(bbox)을 조회하면 겹치는 칸만 훑고, 마지막에 정확한 범위로 한 번 더 거릅니다.
+    조회 결과가 너무 많으면 sample()로 칸마다 고르게 골라 보냅니다.
+    """
+
+    def __init__(self, lats, lons, cell_deg=GRID_CELL_DEG):
+        self.lats = np.asarray(lats, dtype=float)
+        self.lons = np.asarray(lons, dtype=float)
+        self.cell_deg = cell_deg
+
+        rows = np.floor(self.lats / cell_deg).astype(np.int64)
+        cols = np.floor(self.lons / cell_deg).astype(np.int64)
+        order = np.lexsort((cols, rows))
+        cells = np.column_stack([rows[order], cols[order]])
+        if len(order):
+            starts = np.flatnonzero(np.r_[True, np.any(cells[1:] != cells[:-1], axis=1)])
+            ends = np.r_[starts[1:], len(order)]
+        else:
+            starts = ends = np.array([], dtype=int)
+        self._cells = {
+            (int(cells[s, 0]), int(cells[s, 1])): order[s:e] for s, e in zip(starts, ends)
+        }
+        # 지점마다 속한 칸 번호와, 칸 안에서 고를 순서를 정하는 고정 난수 (리런마다 같은 지점이 뽑히도록 seed 고정)
+        self._cell_of = np.empty(len(order), dtype=np.int64)
+        for i, (s, e) in enumerate(zip(starts, ends)):
+            self._cell_of[order[s:e]] = i
+        self._jitter = np.random.default_rng(0).random(len(order))
+
+    def __len__(self):
+        return len(self.lats)
+
+    def query(self, south, west, north, east):
+        """bbox 안에 있는 지점 번호를 오름차순으로 돌려줍니다."""
+        r0, r1 = math.floor(south / self.cell_deg), math.floor(north / self.cell_deg)
+        c0, c1 = math.floor(west / self.cell_deg), math.floor(east / self.cell_deg)
+
+        if (r1 - r0 + 1) * (c1 - c0 + 1) > len(self._cells):
+            # 많이 축소해서 칸 수가 더 많으면 전체를 한 번에 거르는 편이 빠릅니다.
+            candidates = np.arange(len(self.lats))
+        else:
+            found = [
+                self._cells[(r, c)]
+                for r in range(r0, r1 + 1)
+                for c in range(c0, c1 + 1)
+                if (r, c) in self._cells
+            ]
+            if not found:
+                return np.array([], dtype=np.int64)
+            candidates = np.concatenate(found)
+
+        lat = self.lats[candidates]
+        lon = self.lons[candidates]
+        inside = (lat >= south) & (lat <= north) & (lon >= west) & (lon <= east)
+        return np.sort(candidates[inside])
+
+    def sample(self, indices, limit):
+        """지점 번호 중 최대 limit개를 격자 칸마다 고르게 골라 오름차순으로 돌려줍니다.
+
+        앞에서부터 자르면 파일 순서대로 잘려 한쪽 지역만 남으므로, 칸마다 한 개씩 돌아가며 고릅니다.
+        (모든 칸에서 첫 번째 → 두 번째 → ...) 칸 안에서는 고정 난수 순서로 고릅니다.
+        """
+        indices = np.asarray(indices)
+        if len(indices) <= limit:
+            return indices
+        cells = self._cell_of[indices]
+        jitter = self._jitter[indices]
+
+        # 칸별로 모은 뒤 칸 안에서의 순번(rank)을 매깁니다.
+        order = np.lexsort((jitter, cells))
+        sorted_cells = cells[order]
+        starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+
+        picked = np.lexsort((jitter, rank))[:limit]
+        return np.sort(indices[picked])
+
+
+def viewport_bbox(center, zoom, width, height):
+    """지도 중심·줌·크기(px)로 화면에 보이는 영역을 어림합니다. (st_folium이 아직 bounds를 보내지 않았을 때)"""
+    lon_span = width * 360 / (256 * 2 ** zoom)
+    lat_span = height * 360 / (256 * 2 ** zoom) * math.cos(math.radians(center[0]))
+    return (
+        center[0] - lat_span / 2,
+        center[1] - lon_span / 2,
+        center[0] + lat_span / 2,
+        center[1] + lon_span / 2,
+    )
+
+
+def pad_bbox(bbox, ratio=0.25):
+    """화면 바로 바깥의 관광지도 미리 보내도록 영역을 사방으로 ratio만큼 넓힙니다."""
+    south, west, north, east = bbox
+    dlat = (north - south) * ratio
+    dlon = (east - west) * ratio
+    return south - dlat, west - dlon, north + dlat, east + dlon
+
+
+def bounds_to_bbox(bounds):
+    """st_folium이 돌려준 bounds를 (south, west, north, east)로 바꿉니다. 값이 없으면 None입니다."""
+    if not bounds:
+        return None
+    south_west = bounds.get("_southWest") or {}
+    north_east = bounds.get("_northEast") or {}
+    values = (south_west.get("lat"), south_west.get("lng"), north_east.get("lat"), north_east.get("lng"))
+    if any(v is None for v in values):
+        return None
+    return values
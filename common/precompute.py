@@ -0,0 +1,115 @@
+"""배포 직후 첫 방문자 대신 무거운 결과물을 미리 만들어 두는 명령입니다.
+
+    python -m common.precompute [--jobs 4] [--only subway_rankings poi_table] [--force]
+
+1단계에서 원본 CSV를 컬럼형 파일로 바꾸고, 2단계에서 그 파일로 집계·순위·지도용 표를 만듭니다.
+각 단계의 작업은 프로세스 풀에서 동시에 돌아갑니다. 결과는 캐시 폴더(DUBBONG_CACHE_DIR)에 저장되고,
+페이지는 같은 파일을 열기만 합니다.
+승·하차 파일이 승·하차 데이터가 아니면 (예: 저장소에 들어 있는 가축 CSV) 지하철 작업은 실패 대신 건너뜀으로 표시합니다.
+실패한 작업이 있을 때만 종료 코드 1입니다.
+--force를 주면 저장된 아티팩트와 큐브가 있어도 다시 만듭니다. (보통은 원본이나 만드는 코드가 바뀌었을 때만 새로 만듦)
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+from common import artifacts, cube
+from common.cube import load_cube
+from common.livestock import load_livestock
+from common.paths import CACHE_DIR
+from common.pois import load_pois
+from common.stations import load_stations
+from common.subway import load_subway
+
+class Skipped(Exception):
+    """원본 파일이 이 작업이 기대하는 데이터가 아니어서 만들 것이 없음"""
+
+
+def _subway_only(build):
+    """승·하차 컬럼이 없는 파일이면 Skipped를 냅니다. (artifacts._ridership_or_none과 같은 판단: KeyError)"""
+    try:
+        return build()
+    except KeyError as exc:
+        raise Skipped(f"승·하차 데이터가 아닙니다 (없는 컬럼: {exc})") from exc
+
+
+# (이름, 함수) 목록을 단계별로 둡니다. 같은 단계의 작업끼리는 서로 기다리지 않습니다.
+STAGES = [
+    [
+        ("livestock_frame", load_livestock),
+        ("subway_frame", partial(_subway_only, load_subway)),
+        ("poi_frame", load_pois),
+        ("station_frame", load_stations),
+    ],
+    [
+        ("livestock_cube", load_cube),
+        ("livestock_sigungu", artifacts.livestock_sigungu),
+        ("livestock_distribution", artifacts.livestock_distribution),
+        ("subway_rankings", partial(_subway_only, artifacts.subway_rankings)),
+        ("poi_table", artifacts.poi_table),
+    ],
+]
+TASK_NAMES = [name for stage in STAGES for name, _ in stage]
+
+
+def _run(name, build):
+    start = time.perf_counter()
+    build()
+    return time.perf_counter() - start
+
+
+def _init_worker(force):
+    artifacts.FORCE = force
+    cube.FORCE = force
+
+
+def precompute(jobs=None, only=None, force=False):
+    """모든 단계를 차례로 실행하고 [(이름, 상태, 걸린 시간 또는 메시지)]를 돌려줍니다. 상태는 'ok', 'skipped', 'failed'입니다."""
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(force,)) as pool:
+        for stage in STAGES:
+            futures = {
+                pool.submit(_run, name, build): name
+                for name, build in stage
+                if only is None or name in only
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results.append((name, "ok", future.result()))
+                except Skipped as exc:
+                    results.append((name, "skipped", str(exc)))
+                except Exception as exc:  # 한 작업이 실패해도 나머지는 계속 만듭니다.
+                    results.append((name, "failed", f"{type(exc).__name__}: {exc}"))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="페이지 아티팩트를 미리 만들어 둡니다.")
+    parser.add_argument("--jobs", type=int, default=None, help="동시에 돌릴 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--only", nargs="+", choices=TASK_NAMES, help="이 작업만 실행")
+    parser.add_argument("--force", action="store_true", help="저장된 아티팩트·큐브가 있어도 다시 만듦")
+    args = parser.parse_args(argv)
+
+    print(f"캐시 폴더: {CACHE_DIR}")
+    start = time.perf_counter()
+    results = precompute(args.jobs, set(args.only) if args.only else None, args.force)
+
+    failed = skipped = 0
+    for name, status, detail in results:
+        if status == "ok":
+            print(f"  {name:<24} {detail:8.3f}s")
+        elif status == "skipped":
+            skipped += 1
+            print(f"  {name:<24}   건너뜀  {detail}")
+        else:
+            failed += 1
+            print(f"  {name:<24}   실패  {detail}")
+    print(f"전체 {time.perf_counter() - start:.3f}s · 건너뜀 {skipped}개 · 실패 {failed}개")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
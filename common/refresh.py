@@ -0,0 +1,106 @@
+"""데이터 파일을 백그라운드 스레드에서 지켜보다가, 바뀌면 새 데이터셋을 만들어 통째로 바꿔 끼웁니다.
+
+    source = Refresher("livestock", DATA_FILE, build_dataset).start()
+    version, dataset = source.get()      # 리런은 파일을 읽지 않고 지금 들고 있는 버전을 바로 받습니다.
+
+워커 스레드가 POLL_SECONDS마다 파일의 (mtime, 크기)를 보고, 바뀐 값이 다음 주기에도 그대로면(다 쓴 파일이면)
+내용 해시(file_version)를 구해 build()를 다시 실행합니다. 새 데이터셋이 다 만들어질 때까지 세션들은 이전 버전을 씁니다.
+서버가 막 떠서 보여줄 데이터가 아직 없을 때만 get()이 첫 빌드를 기다립니다.
+"""
+import os
+import threading
+import time
+
+from common import perf
+from common.paths import file_version, resolve_path
+
+# 파일을 확인하는 주기(초)
+POLL_SECONDS = float(os.environ.get("DUBBONG_REFRESH_SECONDS", "2"))
+
+
+class Refresher:
+    """파일 하나에서 만든 데이터셋의 (버전, 값)을 들고 있고, 워커 스레드에서 새 버전으로 바꿔 끼웁니다."""
+
+    def __init__(self, name, file_path, build, interval=POLL_SECONDS):
+        self.name = name
+        self.path = resolve_path(file_path)
+        self.build = build
+        self.interval = interval
+        self.error = None  # 마지막 빌드에서 난 예외 (실패해도 이전 버전을 계속 씀)
+        # (버전, 값)을 튜플 하나로 통째로 바꿔서, 읽는 쪽이 버전과 값이 어긋난 상태를 보지 않게 합니다.
+        self._current = (None, None)
+        self._seen = None  # 마지막으로 처리한 (mtime, 크기)
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"refresh-{name}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """워커 스레드를 멈춥니다. (st.cache_resource의 on_release로 씀)"""
+        self._stop.set()
+
+    def get(self):
+        """(버전, 값)을 돌려줍니다. 파일이 없으면 (None, None)이고, 첫 빌드가 실패했으면 RuntimeError를 냅니다.
+
+        원래 예외는 __cause__로 붙입니다. (같은 예외 객체를 리런마다 다시 던지면 traceback이 계속 길어짐)
+        """
+        self._ready.wait()
+        current = self._current
+        error = self.error
+        if current[0] is None and error is not None:
+            raise RuntimeError(f"{self.name} 데이터를 만들지 못했습니다: {type(error).__name__}: {error}") from error
+        return current
+
+    def _stat(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self, stat):
+        self._seen = stat
+        if stat is None:
+            # 파일이 (잠깐) 없어져도 이미 만든 버전은 그대로 둡니다.
+            return
+
+        start = time.perf_counter()
+        try:
+            version = file_version(self.path)
+            if version == self._current[0]:
+                self.error = None
+                return  # 내용이 지금 버전과 같음 (mtime만 바뀌었거나 원래 파일로 되돌림)
+            value = self.build()
+        except Exception as exc:  # 잘못된 파일이 올라와도 스레드는 살려 두고 이전 버전을 계속 씁니다.
+            self.error = exc
+            perf.record_refresh(self.name, time.perf_counter() - start, failed=True)
+            return
+
+        # 만드는 동안 파일이 또 바뀌었으면, 이미 보여주던 버전이 있을 때는 이 결과를 버리고 다음 주기에 다시 만듭니다.
+        if self._stat() != stat:
+            self._seen = None
+            if self._current[0] is not None:
+                return
+
+        self._current = (version, value)
+        self.error = None
+        perf.record_refresh(self.name, time.perf_counter() - start)
+
+    def _run(self):
+        self._refresh(self._stat())
+        self._ready.set()
+
+        pending = None
+        while not self._stop.wait(self.interval):
+            stat = self._stat()
+            if stat == self._seen:
+                pending = None
+            elif stat == pending:
+                # 한 주기 동안 그대로였으면 쓰기가 끝난 것으로 봅니다.
+                self._refresh(stat)
+                pending = None
+            else:
+                pending = stat
@@ -0,0 +1,76 @@
+"""지하철역 좌표 테이블과 KD-tree 공간 인덱스입니다. 관광지마다 가까운 역 k개를 한 번에 찾습니다."""
+import numpy as np
+import pandas as pd
+
+from common.data import load_frame
+from common.itinerary import EARTH_RADIUS_KM
+
+STATIONS_FILE = "subway_stations.csv"
+
+# 이보다 먼 역은 '가까운 역'으로 연결하지 않습니다. (km)
+# 역 테이블에 도심 역만 있어도 외곽 관광지가 수십 km 떨어진 역에 붙지 않게 합니다.
+MAX_STATION_KM = 2.0
+
+
+def load_stations(file_path=STATIONS_FILE):
+    """역 좌표 테이블(노선명, 역명, lat, lon)을 불러옵니다."""
+    return load_frame(file_path)
+
+
+def _unit_xyz(lats, lons):
+    # 위경도를 단위 구 위의 3차원 좌표로 바꾸면, 직선 거리 순서가 실제 구면 거리 순서와 같아집니다.
+    lat = np.radians(np.asarray(lats, dtype=float))
+    lon = np.radians(np.asarray(lons, dtype=float))
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def station_label(line, name):
+    """'3호선', '안국' → '3호선 안국역' ('서울역'처럼 이미 '역'으로 끝나면 그대로)"""
+    return f"{line} {name}" if name.endswith("역") else f"{line} {name}역"
+
+
+class StationIndex:
+    """역 좌표로 만든 KD-tree입니다."""
+
+    def __init__(self, stations):
+        # scipy는 인덱스를 새로 만들 때만 필요합니다. (미리 만든 관광지 표를 여는 경우엔 불러오지 않음)
+        from scipy.spatial import cKDTree
+
+        self.stations = stations.reset_index(drop=True)
+        self._tree = cKDTree(_unit_xyz(self.stations["lat"], self.stations["lon"]))
+
+    def nearest(self, lats, lons, k=2):
+        """모든 지점에 대해 가까운 역 k개를 한 번에 찾습니다.
+
+        반환값: (거리 km 배열, 역 번호 배열), 둘 다 모양은 (지점 수, k)
+        """
+        k = min(k, len(self.stations))
+        chord, idx = self._tree.query(_unit_xyz(lats, lons), k=k)
+        chord = np.asarray(chord).reshape(len(idx), -1)
+        idx = np.asarray(idx).reshape(len(chord), -1)
+        # 현(chord) 길이 → 구면 거리
+        dist_km = 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0.0, 1.0))
+        return dist_km, idx
+
+
+def link_pois(pois, station_index, ridership=None, k=2, max_km=MAX_STATION_KM):
+    """관광지마다 가까운 역 k개를 붙인 긴 형태의 표를 만듭니다.
+
+    컬럼: name, 순위, 노선명, 역명, 거리_km, 총승하차(ridership이 있으면)
+    관광지마다 항상 k행(역이 k개보다 적으면 역 수만큼)이 붙고, max_km보다 먼 역은 노선명·역명·거리_km를 비워 둡니다.
+    """
+    dist_km, idx = station_index.nearest(pois["lat"].to_numpy(), pois["lon"].to_numpy(), k)
+    n, k = idx.shape
+    matched = station_index.stations.iloc[idx.ravel()][["노선명", "역명"]].reset_index(drop=True)
+    links = pd.DataFrame({
+        "name": np.repeat(pois["name"].to_numpy(), k),
+        "순위": np.tile(np.arange(1, k + 1), n),
+    })
+    links = pd.concat([links, matched], axis=1)
+    links["거리_km"] = dist_km.ravel()
+    links.loc[links["거리_km"] > max_km, ["노선명", "역명", "거리_km"]] = None
+
+    if ridership is not None:
+        keyed = ridership.astype({"노선명": str, "역명": str})
+        links = links.merge(keyed, on=["노선명", "역명"], how="left")
+    return links
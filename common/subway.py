@@ -0,0 +1,158 @@
+"""지하철 승·하차 데이터의 전처리와 (날짜, 호선) 조회용 인덱스입니다."""
+import numpy as np
+import pandas as pd
+
+from common.data import DEFAULT_CHUNKSIZE, compact_frame, load_frame, stream_csv
+
+DATA_FILE = "dubbongispig.csv"
+DATA_ENCODINGS = ("cp949",)
+
+# 날짜·호선·역명은 같은 값이 계속 반복되므로 category로 둡니다.
+CATEGORY_COLS = ["사용일자", "노선명", "역명"]
+INT32_COLS = ["승차총승객수", "하차총승객수", "총승하차"]
+
+
+def prepare_subway(df):
+    """날짜를 문자열로 바꾸고 승·하차 총합 컬럼을 미리 계산해 둡니다."""
+    df = df.copy()
+    df["사용일자"] = df["사용일자"].astype(str)
+    df["총승하차"] = df["승차총승객수"] + df["하차총승객수"]
+    return df
+
+
+def compact_subway(df):
+    return compact_frame(df, categorical=CATEGORY_COLS, int32=INT32_COLS)
+
+
+def load_subway(file_path=DATA_FILE):
+    """전처리까지 끝난 지하철 데이터를 컬럼형 캐시에서 불러옵니다."""
+    return load_frame(file_path, prepare=prepare_subway, encodings=DATA_ENCODINGS, compact=compact_subway)
+
+
+def stream_subway(file_path=DATA_FILE, dates=None, lines=None, group_by=None, chunksize=DEFAULT_CHUNKSIZE):
+    """큰 승·하차 파일을 조각 단위로 읽습니다. 날짜/호선 필터와 집계를 읽는 중에 적용합니다.
+
+    관광지 표(common.artifacts.poi_table)의 역별 이용객 수가 group_by=['노선명', '역명']으로 이 방식을 씁니다.
+    """
+    def row_filter(chunk):
+        mask = chunk["노선명"].notna()
+        if dates is not None:
+            mask &= chunk["사용일자"].isin([str(d) for d in dates])
+        if lines is not None:
+            mask &= chunk["노선명"].isin(list(lines))
+        return mask
+
+    return stream_csv(
+        file_path,
+        prepare=prepare_subway,
+        compact=compact_subway,
+        row_filter=row_filter,
+        group_by=group_by,
+        measures=INT32_COLS,
+        chunksize=chunksize,
+        encodings=DATA_ENCODINGS,
+    )
+
+
+def rank_stations(df):
+    """(날짜, 호선) 안에서 총승하차 내림차순이 되도록 전체를 한 번 정렬합니다."""
+    return df.sort_values(
+        ["사용일자", "노선명", "총승하차"], ascending=[True, True, False], kind="stable"
+    ).reset_index(drop=True)
+
+
+def split_rankings(ordered):
+    """rank_stations로 정렬된 프레임을 (날짜, 호선)별 역 목록으로 나눕니다.
+
+    반환값: (인덱스 딕셔너리, 날짜 목록, 호선 목록)
+    """
+    index = {key: group.reset_index(drop=True) for key, group in ordered.groupby(["사용일자", "노선명"], sort=False, observed=True)}
+    unique_dates = sorted(ordered["사용일자"].unique())
+    lines = sorted(ordered["노선명"].unique())
+    return index, unique_dates, lines
+
+
+def build_station_index(df):
+    """(날짜, 호선)마다 총승하차 내림차순으로 정렬된 역 목록을 미리 나눠 둡니다.
+
+    전체 정렬은 한 번만 하고, 선택이 바뀔 때는 딕셔너리 조회만 하면 됩니다.
+    반환값: (인덱스 딕셔너리, 날짜 목록, 호선 목록)
+    """
+    return split_rankings(rank_stations(df))
+
+
+def top_k_stations(stations, k):
+    """총승하차 상위 k개 역과 나머지 역의 (개수, 합계)를 돌려줍니다.
+
+    stations는 총승하차 내림차순으로 정렬돼 있어야 합니다. (rank_stations → split_rankings로 나눈 역 목록)
+    그래서 다시 정렬하거나 고르지 않고 앞에서 k개를 자르고, 나머지는 뒤쪽을 더하기만 합니다.
+    k가 None이거나 역 수보다 크면 전체를 그대로 돌려주고 나머지는 (0, 0)입니다.
+    """
+    if k is None or len(stations) <= k:
+        return stations, (0, 0)
+
+    totals = stations["총승하차"].to_numpy()
+    return stations.iloc[:k].reset_index(drop=True), (len(totals) - k, int(totals[k:].sum()))
+
+
+def station_ridership(df):
+    """역(호선, 역명)별 전체 기간 승·하차 합계입니다."""
+    return (
+        df.astype({"총승하차": "int64"})
+        .groupby(["노선명", "역명"], as_index=False, observed=True)["총승하차"]
+        .sum()
+    )
+
+
+class RidershipMatrix:
+    """(날짜 × 역) 총승하차를 담은 빽빽한(dense) NumPy 행렬입니다.
+
+    한 달 보기의 역별·호선별 일별 추이와 평일/주말 비교는 모두 이 행렬을 잘라서 만듭니다.
+    """
+
+    def __init__(self, df):
+        date_codes, dates = pd.factorize(df["사용일자"].astype(str), sort=True)
+        station_keys = df["노선명"].astype(str) + "\t" + df["역명"].astype(str)
+        station_codes, keys = pd.factorize(station_keys, sort=True)
+
+        self.dates = np.asarray(dates)
+        self.values = np.zeros((len(dates), len(keys)), dtype=np.int64)
+        np.add.at(self.values, (date_codes, station_codes), df["총승하차"].to_numpy(dtype=np.int64))
+
+        split = pd.Series(keys).str.split("\t", expand=True)
+        self.station_lines = split[0].to_numpy() if len(keys) else np.array([], dtype=object)
+        self.station_names = split[1].to_numpy() if len(keys) else np.array([], dtype=object)
+        self.lines = sorted(set(self.station_lines))
+
+        # 호선별 합계 행렬 (날짜 × 호선) = 역 행렬 @ 역→호선 원-핫 행렬
+        line_codes = np.searchsorted(self.lines, self.station_lines)
+        onehot = np.zeros((len(keys), len(self.lines)), dtype=np.int64)
+        onehot[np.arange(len(keys)), line_codes] = 1
+        self.line_values = self.values @ onehot
+
+        # 토·일요일 여부 (공휴일은 따로 구분하지 않음)
+        self.weekend = pd.to_datetime(self.dates, format="%Y%m%d").dayofweek.to_numpy() >= 5
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.line_values.nbytes + self.dates.nbytes + self.weekend.nbytes
+
+    def stations_of(self, line):
+        """호선에 속한 역의 열 번호를 한 달 합계 내림차순으로 돌려줍니다."""
+        cols = np.flatnonzero(self.station_lines == line)
+        return cols[np.argsort(-self.values[:, cols].sum(axis=0), kind="stable")]
+
+    def station_series(self, cols):
+        """역(열 번호들)의 일별 추이 (날짜 × 역)"""
+        return self.values[:, cols]
+
+    def line_series(self, line):
+        """호선 전체의 일별 합계"""
+        return self.line_values[:, self.lines.index(line)]
+
+    def weekday_weekend(self, cols):
+        """역별 (평일 하루 평균, 주말 하루 평균)"""
+        block = self.values[:, cols]
+        weekday = block[~self.weekend].mean(axis=0) if (~self.weekend).any() else np.zeros(len(cols))
+        weekend = block[self.weekend].mean(axis=0) if self.weekend.any() else np.zeros(len(cols))
+        return weekday, weekend
@@ -1,234 +1,89 @@
 # streamlit_app.py
 import streamlit as st
 
-st.set_page_config(page_title="MBTI 진로 추천 💡", page_icon="🧭", layout="centered")
-
-st.title("✨ MBTI 기반 진로 추천기")
-st.write("MBTI를 하나 골라주면, 그 유형에 잘 맞는 **진로 2개**와 각 진로에 어울리는 **학과**·**성격 특징**을 알려줄게요. 부담 갖지 말고 골라봐요! 😄")
-
-mbti_types = [
-    "ISTJ","ISFJ","INFJ","INTJ",
-    "ISTP","ISFP","INFP","INTP",
-    "ESTP","ESFP","ENFP","ENTP",
-    "ESTJ","ESFJ","ENFJ","ENTJ"
-]
-
-st.markdown("### 1) MBTI 선택")
-choice = st.selectbox("본인의 MBTI를 골라주세요:", ["선택하세요"] + mbti_types)
-
-# 데이터: 각 MBTI별 진로(2), 각 진로에 대한 학과와 성격 설명
-MBTI_CAREERS = {
-    "ISTJ": [
-        {
-            "career": "회계사 / 세무사 📊",
-            "majors": ["회계학", "세무학", "경영학"],
-            "personality": ["규칙을 잘 지키고 꼼꼼한 성격", "책임감 있고 사실 기반으로 판단함"]
-        },
-        {
-            "career": "토목/건축 엔지니어 🏗️",
-            "majors": ["토목공학", "건축공학", "건설관리"],
-            "personality": ["실무 중심으로 차근차근 해결하는 타입", "계획적이고 안전을 중시함"]
-        }
-    ],
-    "ISFJ": [
-        {
-            "career": "간호사 / 보건 의료직 ❤️",
-            "majors": ["간호학", "보건학", "임상병리학"],
-            "personality": ["상대에게 세심하게 신경쓰는 타입", "헌신적이고 책임감이 강함"]
-        },
-        {
-            "career": "사회복지사 / 상담 지원업무 🤝",
-            "majors": ["사회복지학", "아동학", "상담심리학"],
-            "personality": ["다른 사람 돕는 일에서 보람을 느낌", "현실적·따뜻한 배려형"]
-        }
-    ],
-    "INFJ": [
-        {
-            "career": "상담가 / 임상 심리사 🧠",
-            "majors": ["심리학", "상담학", "복지학"],
-            "personality": ["사람의 마음을 잘 읽고 공감하는 능력", "깊이 생각하고 의미를 추구함"]
-        },
-        {
-            "career": "작가 / 콘텐츠 크리에이터 ✍️",
-            "majors": ["국어국문학", "문예창작", "미디어학"],
-            "personality": ["창의적이고 내면 표현에 능함", "감성적이면서 통찰력 있음"]
-        }
-    ],
-    "INTJ": [
-        {
-            "career": "연구원 / 데이터 분석가 🔬",
-            "majors": ["전산학", "통계학", "수학"],
-            "personality": ["전략적이고 논리적인 문제 해결자", "장기 목표 설정을 잘함"]
-        },
-        {
-            "career": "건축가 / 시스템 설계자 🧩",
-            "majors": ["건축학", "컴퓨터공학", "시스템공학"],
-            "personality": ["구조와 설계에 흥미가 있음", "독립적으로 일하는 걸 선호함"]
-        }
-    ],
-    "ISTP": [
-        {
-            "career": "기계/전자 기술자 / 정비사 🔧",
-            "majors": ["기계공학", "전기·전자공학", "자동차공학"],
-            "personality": ["손으로 만지고 해결하는 실무형", "문제 상황에서 침착하고 실용적"]
-        },
-        {
-            "career": "항공조종사 / 항공기술자 ✈️",
-            "majors": ["항공학", "기계공학", "항공전자"],
-            "personality": ["위기 대응 능력이 좋고 현실적", "스릴을 즐기면서도 규칙 준수 함"]
-        }
-    ],
-    "ISFP": [
-        {
-            "career": "디자이너 / 일러스트레이터 🎨",
-            "majors": ["시각디자인", "예술학", "패션디자인"],
-            "personality": ["감각적이고 창의적인 표현을 좋아함", "자유롭고 섬세한 감성 소유"]
-        },
-        {
-            "career": "사진작가 / 영상 제작자 📷",
-            "majors": ["영상학", "사진학", "미디어아트"],
-            "personality": ["순간을 포착하고 표현하는 능력", "감성적이고 현장 중심으로 일함"]
-        }
-    ],
-    "INFP": [
-        {
-            "career": "문학가 / 콘텐츠 작가 📝",
-            "majors": ["국어국문학", "문예창작", "미디어콘텐츠"],
-            "personality": ["가치관이 뚜렷하고 창의적", "자기 표현과 이상을 중요시함"]
-        },
-        {
-            "career": "상담사 / 사회적 기획자 🌱",
-            "majors": ["심리학", "사회복지학", "교육학"],
-            "personality": ["타인을 깊이 이해하려는 성향", "아이디어로 사회에 기여하고 싶어함"]
-        }
-    ],
-    "INTP": [
-        {
-            "career": "소프트웨어 개발자 / 연구개발자 💻",
-            "majors": ["컴퓨터공학", "소프트웨어학", "전산학"],
-            "personality": ["논리적이고 호기심 많은 문제해결자", "이론적 분석을 즐김"]
-        },
-        {
-            "career": "데이터 과학자 / 알고리즘 연구 🔢",
-            "majors": ["통계학", "데이터사이언스", "수학"],
-            "personality": ["패턴과 구조를 잘 파악함", "혼자서 깊게 파고드는 걸 선호"]
-        }
-    ],
-    "ESTP": [
-        {
-            "career": "영업/마케팅 실무자 🗣️",
-            "majors": ["경영학", "마케팅", "커뮤니케이션학"],
-            "personality": ["사람과 바로 소통하면서 에너지 얻음", "빠른 의사결정과 행동력 보유"]
-        },
-        {
-            "career": "응급구조 / 현장 중심 직업 🚑",
-            "majors": ["응급구조학", "체육학", "보건학"],
-            "personality": ["실전에서 침착하게 일함", "액션 지향적이고 적응력 좋음"]
-        }
-    ],
-    "ESFP": [
-        {
-            "career": "연예/공연 (배우·가수) 🎤",
-            "majors": ["연기학", "음악학", "무대예술"],
-            "personality": ["사람들 앞에서 빛나는 타입", "즉흥적이며 표현력이 풍부함"]
-        },
-        {
-            "career": "이벤트 플래너 / 관광 서비스 ✨",
-            "majors": ["관광학", "서비스경영", "경영학"],
-            "personality": ["사교적이고 분위기 메이커", "실무에서 사람을 즐겁게 함"]
-        }
-    ],
-    "ENFP": [
-        {
-            "career": "광고·콘텐츠 기획자 / 크리에이터 🌈",
-            "majors": ["미디어학", "광고홍보", "콘텐츠학"],
-            "personality": ["아이디어가 풍부하고 사람들에게 영향 줌", "열정적이고 낙천적"]
-        },
-        {
-            "career": "교사 / 멘토 👩‍🏫",
-            "majors": ["교육학", "아동학", "심리학"],
-            "personality": ["사람을 격려하고 동기부여 잘함", "융통성 있고 친근한 스타일"]
-        }
-    ],
-    "ENTP": [
-        {
-            "career": "창업가 / 스타트업 운영자 🚀",
-            "majors": ["경영학", "산업공학", "컴퓨터공학"],
-            "personality": ["새로운 기회를 빠르게 찾아내는 편", "논쟁을 즐기며 아이디어 실험적"]
-        },
-        {
-            "career": "변호사(특히 소송) / 정책 분석가 ⚖️",
-            "majors": ["법학", "정치외교학", "행정학"],
-            "personality": ["언변이 좋고 토론을 즐김", "논리적으로 설득하는 능력 뛰어남"]
-        }
-    ],
-    "ESTJ": [
-        {
-            "career": "경영관리자 / 운영 책임자 🧭",
-            "majors": ["경영학", "산업관리", "회계학"],
-            "personality": ["조직을 운영하고 규칙을 세우는 데 능함", "결단력 있고 책임감 강함"]
-        },
-        {
-            "career": "공무원 / 행정직 🏛️",
-            "majors": ["행정학", "법학", "정치학"],
-            "personality": ["체계적이고 규범을 중시함", "안정적 환경에서 잘함"]
-        }
-    ],
-    "ESFJ": [
-        {
-            "career": "초등교사 / 유아교육 교사 🍎",
-            "majors": ["교육학", "유아교육", "아동학"],
-            "personality": ["사람 돌보는 걸 좋아하고 친절함", "조직과 팀워크를 중시함"]
-        },
-        {
-            "career": "인사(HR) / 고객관리 담당 🌟",
-            "majors": ["경영학", "심리학", "커뮤니케이션학"],
-            "personality": ["사람을 챙기고 조율하는 능력 탁월", "실무적이고 신뢰감 줌"]
-        }
-    ],
-    "ENFJ": [
-        {
-            "career": "교육자 / 리더십 코치 🧑‍🏫",
-            "majors": ["교육학", "경영학", "심리학"],
-            "personality": ["사람을 이끌고 영감을 주는 스타일", "공감 능력과 설득력 보유"]
-        },
-        {
-            "career": "공공정책 / NGO 활동가 🌍",
-            "majors": ["사회복지학", "국제학", "정책학"],
-            "personality": ["타인을 위해 변화를 만드는 데 동기 부여됨", "의사소통 능력 우수"]
-        }
-    ],
-    "ENTJ": [
-        {
-            "career": "기업 경영자 / 컨설턴트 📈",
-            "majors": ["경영학", "경제학", "산업공학"],
-            "personality": ["목표 지향적이고 조직을 이끄는 능력", "전략적 사고와 추진력 있음"]
-        },
-        {
-            "career": "금융 분석가 / 투자 전문가 💹",
-            "majors": ["금융학", "경제학", "통계학"],
-            "personality": ["데이터로 결정을 내리며 성과를 중시", "결단력 있고 경쟁적"]
-        }
-    ],
-}
-
-st.markdown("---")
-
-if choice == "선택하세요":
-    st.info("MBTI를 선택하면 추천 진로와 설명을 보여줄게요 🙂")
-else:
-    st.markdown(f"## {choice}님을 위한 추천 진로 🔎")
-    careers = MBTI_CAREERS.get(choice, [])
-    for idx, item in enumerate(careers, start=1):
-        st.markdown(f"### {idx}. {item['career']}")
-        st.write("- **추천 학과:** " + ", ".join(item["majors"]))
-        st.write("- **어떤 성격이 잘 맞을까?**")
-        for p in item["personality"]:
-            st.write(f"  - {p}")
-        st.write("")  # spacing
-
-    st.success("도움됐어? 더 궁금한 진로가 있으면 말해줘 — 관련된 학과 커리큘럼 예시나 공부 방법도 알려줄게! 🎯")
-
-st.write("---")
-st.caption("참고: 이 추천은 일반적인 성향 기반 가이드예요. 같은 MBTI라도 개인의 흥미·경험에 따라 잘 맞는 길은 달라요! 💡")
+from common import perf
+from common.mbti import AXES, CATALOG_FILE, MBTI_TYPES, CareerCatalog
+from common.paths import file_version
 
+# 데이터: 진로 카탈로그(mbti_careers.json)를 파일 버전마다 한 번만 읽고 역색인을 만들어 모든 세션이 같이 씁니다.
+@st.cache_resource(max_entries=2)
+def load_catalog(catalog_version):
+    perf.mark_miss()
+    return CareerCatalog.from_file(CATALOG_FILE)
+
+# 학과·키워드 검색에서 한 번에 보여줄 최대 진로 수
+MAX_RESULTS = 20
+
+
+def show_career(idx, item, show_types=False):
+    st.markdown(f"### {idx}. {item['career']}")
+    if show_types:
+        st.write("- **잘 맞는 MBTI:** " + ", ".join(item["types"]))
+    st.write("- **추천 학과:** " + ", ".join(item["majors"]))
+    st.write("- **어떤 성격이 잘 맞을까?**")
+    for p in item["personality"]:
+        st.write(f"  - {p}")
+    st.write("")  # spacing
+
+
+def show_results(careers):
+    if not careers:
+        st.info("조건에 맞는 진로가 없어요. 조건을 조금 바꿔볼까요? 🙂")
+        return
+    st.caption(f"모두 {len(careers)}개 진로" + (f" 중 {MAX_RESULTS}개만 보여줄게요" if len(careers) > MAX_RESULTS else ""))
+    for idx, item in enumerate(careers[:MAX_RESULTS], start=1):
+        show_career(idx, item, show_types=True)
+
+
+with perf.rerun("00_mbti진로"):
+    st.set_page_config(page_title="MBTI 진로 추천 💡", page_icon="🧭", layout="centered")
+
+    st.title("✨ MBTI 기반 진로 추천기")
+    st.write("MBTI를 하나 골라주면, 그 유형에 잘 맞는 **진로 2개**와 각 진로에 어울리는 **학과**·**성격 특징**을 알려줄게요. 부담 갖지 말고 골라봐요! 😄")
+
+    with perf.stage("data_version"):
+        catalog_version = file_version(CATALOG_FILE)
+    with perf.stage("load_catalog", cache=True):
+        catalog = load_catalog(catalog_version)
+
+    st.markdown("### 1) MBTI 선택")
+    choice = st.selectbox("본인의 MBTI를 골라주세요:", ["선택하세요"] + MBTI_TYPES)
+
+    st.markdown("---")
+
+    if choice == "선택하세요":
+        st.info("MBTI를 선택하면 추천 진로와 설명을 보여줄게요 🙂")
+    else:
+        st.markdown(f"## {choice}님을 위한 추천 진로 🔎")
+        careers = catalog.for_type(choice)
+        for idx, item in enumerate(careers, start=1):
+            show_career(idx, item)
+
+        st.success("도움됐어? 더 궁금한 진로가 있으면 말해줘 — 관련된 학과 커리큘럼 예시나 공부 방법도 알려줄게! 🎯")
+
+    st.markdown("---")
+    st.markdown("### 2) 다른 방법으로 찾아보기")
+    tab_major, tab_letters, tab_keyword = st.tabs(["🎓 학과로 찾기", "🔤 MBTI 일부만 알 때", "💬 성격 키워드로 찾기"])
+
+    with tab_major:
+        major = st.selectbox("관심 있는 학과를 골라주세요:", ["선택하세요"] + catalog.majors)
+        if major != "선택하세요":
+            show_results(catalog.for_major(major))
+
+    with tab_letters:
+        st.write("확실한 글자만 골라도 돼요. 나머지는 '모름'으로 두세요.")
+        letters = [
+            col.radio(f"{a} / {b}", ["모름", a, b], horizontal=True, key=f"axis_{a}{b}")
+            for col, (a, b) in zip(st.columns(len(AXES)), AXES)
+        ]
+        letters = [letter for letter in letters if letter != "모름"]
+        if letters:
+            show_results(catalog.for_letters(letters))
+
+    with tab_keyword:
+        query = st.text_input("나를 표현하는 단어를 적어보세요 (예: 꼼꼼, 공감, 창의)")
+        if query.strip():
+            show_results(catalog.search(query))
+
+    st.write("---")
+    st.caption("참고: 이 추천은 일반적인 성향 기반 가이드예요. 같은 MBTI라도 개인의 흥미·경험에 따라 잘 맞는 길은 달라요! 💡")
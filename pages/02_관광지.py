@@ -1,89 +1,101 @@
 import streamlit as st
-import folium
 from streamlit_folium import st_folium
-import pandas as pd
-import math
 
-# 기본 설정
-st.set_page_config(page_title="서울 관광지도", page_icon="🗺️", layout="wide")
+from common import perf
+from common.artifacts import poi_table
+from common.data import file_version, frame_nbytes
+from common.itinerary import plan_itinerary
+from common.maps import MAP_CENTER, MAP_ZOOM, MAX_VIEWPORT_POIS, build_base_map, cluster_layer
+from common.pois import POI_FILE, GridIndex, bounds_to_bbox, pad_bbox, viewport_bbox
+from common.stations import STATIONS_FILE
+from common.subway import DATA_FILE as SUBWAY_FILE
 
-# 헤더
-st.title("🗺️ 외국인이 좋아하는 서울 관광지 Top 10")
-st.markdown("서울의 대표 명소들을 지도와 함께 살펴보고, 나만의 여행 일정을 만들어보세요! 🌸")
-
-# 관광지 데이터
-locations = [
-    {"name": "경복궁", "lat": 37.579617, "lon": 126.977041,
-     "desc": "조선시대의 대표 궁궐로, 한국의 역사와 문화를 느낄 수 있는 명소입니다.",
-     "subway": "3호선 경복궁역"},
-    {"name": "명동", "lat": 37.563757, "lon": 126.982684,
-     "desc": "쇼핑과 길거리 음식의 천국으로 외국인 관광객이 가장 많이 찾는 곳입니다.",
-     "subway": "4호선 명동역"},
-    {"name": "남산타워", "lat": 37.551169, "lon": 126.988227,
-     "desc": "서울의 중심에서 시내 전경을 한눈에 볼 수 있는 명소입니다.",
-     "subway": "4호선 명동역"},
-    {"name": "북촌한옥마을", "lat": 37.582604, "lon": 126.983998,
-     "desc": "전통 한옥이 밀집된 지역으로, 한국의 고즈넉한 분위기를 느낄 수 있습니다.",
-     "subway": "3호선 안국역"},
-    {"name": "인사동", "lat": 37.574011, "lon": 126.984834,
-     "desc": "한국 전통문화와 예술이 살아있는 거리로, 전통 찻집과 갤러리가 많습니다.",
-     "subway": "3호선 안국역"},
-    {"name": "홍대", "lat": 37.556316, "lon": 126.922623,
-     "desc": "젊음과 예술의 거리로, 음악, 패션, 자유분위기가 공존합니다.",
-     "subway": "2호선 홍대입구역"},
-    {"name": "동대문디자인플라자(DDP)", "lat": 37.566495, "lon": 127.009044,
-     "desc": "미래적인 건축물과 전시, 야경이 아름다운 서울의 랜드마크입니다.",
-     "subway": "2호선 동대문역사문화공원역"},
-    {"name": "청계천", "lat": 37.570157, "lon": 126.978577,
-     "desc": "도심 속의 힐링 산책로로, 낮과 밤 모두 다른 매력을 느낄 수 있습니다.",
-     "subway": "1호선 종각역"},
-    {"name": "롯데월드타워", "lat": 37.512544, "lon": 127.102567,
-     "desc": "123층 초고층 타워로 전망대, 쇼핑몰, 수족관이 한곳에 모여 있습니다.",
-     "subway": "2호선 잠실역"},
-    {"name": "이태원", "lat": 37.534849, "lon": 126.994416,
-     "desc": "다양한 문화와 세계 각국의 음식을 즐길 수 있는 다국적 거리입니다.",
-     "subway": "6호선 이태원역"}
-]
-
-# 지도 생성
-m = folium.Map(location=[37.5665, 126.9780], zoom_start=12)
-
-# 빨간색 마커 추가
-for loc in locations:
-    popup_html = f"""
-    <b>{loc['name']}</b><br>
-    {loc['desc']}<br>
-    🚇 {loc['subway']}
-    """
-    folium.Marker(
-        [loc["lat"], loc["lon"]],
-        popup=popup_html,
-        tooltip=loc["name"],
-        icon=folium.Icon(color="red", icon="info-sign"),
-    ).add_to(m)
+# 관광지 데이터: 가까운 역과 팝업까지 채운 표(python -m common.precompute로 미리 만들 수 있음)를 열고
+# 격자 인덱스를 만들어 둡니다. (데이터 버전마다 한 번, 모든 세션이 같이 씀)
+@st.cache_resource(max_entries=2)
+def load_poi_index(poi_version, station_version, subway_version):
+    perf.mark_miss()
+    pois = poi_table()
+    perf.record_dataset("poi_table", frame_nbytes(pois))
+    return pois, GridIndex(pois["lat"], pois["lon"]), pois.to_dict("records")
 
 # 지도 표시 (70%)
-st_data = st_folium(m, width=630, height=420)
+# 지도를 움직이면 이 부분만 다시 실행되고, 지금 화면 안에 있는 관광지만 클러스터로 보냅니다.
+MAP_WIDTH, MAP_HEIGHT = 630, 420
+
+@st.fragment
+def show_map():
+    with perf.start_rerun("02_관광지#map"):
+        map_state = st.session_state.get("tour_map") or {}
+        bbox = bounds_to_bbox(map_state.get("bounds")) or viewport_bbox(MAP_CENTER, MAP_ZOOM, MAP_WIDTH, MAP_HEIGHT)
+
+        with perf.stage("viewport_query"):
+            visible = poi_index.query(*pad_bbox(bbox))
+            shown = poi_index.sample(visible, MAX_VIEWPORT_POIS)
+
+        with perf.stage("map_build"):
+            base_map = build_base_map()
+            layer = cluster_layer(pois.iloc[shown])
 
-# 관광지 요약 테이블
-st.subheader("📍 관광지 요약")
-df = pd.DataFrame(
-    [{"명소": loc["name"], "가까운 전철역": loc["subway"], "설명": loc["desc"]} for loc in locations]
-)
-st.dataframe(df, use_container_width=True, hide_index=True)
+        with perf.stage("st_folium"):
+            st_folium(
+                base_map,
+                key="tour_map",
+                width=MAP_WIDTH,
+                height=MAP_HEIGHT,
+                feature_group_to_add=layer,
+                returned_objects=["bounds"],
+            )
+    if len(shown) < len(visible):
+        st.caption(
+            f"지도 영역 안 관광지 {len(visible):,}개 중 지역별로 고르게 {len(shown):,}개 표시 "
+            f"(전체 {len(poi_index):,}개, 확대하면 더 자세히 보입니다)"
+        )
+    else:
+        st.caption(f"지도 영역 안 관광지 {len(shown):,}개 표시 (전체 {len(poi_index):,}개)")
+
+# 관광지 요약 표는 한 번에 이만큼씩 나눠 보여줍니다.
+TABLE_PAGE_ROWS = 50
+
+def show_summary():
+    st.subheader("📍 관광지 요약")
+    n_pages = max(1, -(-len(pois) // TABLE_PAGE_ROWS))
+    page = st.number_input(f"페이지 (1~{n_pages})", 1, n_pages, 1) if n_pages > 1 else 1
+    start = (page - 1) * TABLE_PAGE_ROWS
+    df = pois.iloc[start:start + TABLE_PAGE_ROWS][["name", "nearby", "desc"]].rename(
+        columns={"name": "명소", "nearby": "가까운 전철역", "desc": "설명"}
+    )
+    st.dataframe(df, use_container_width=True, hide_index=True)
+
+# 일정에 넣을 수 있는 최대 관광지 수. 일정 엔진은 N×N 거리 행렬을 만들므로 입력을 사용자가 고른 명소로 제한합니다.
+ITINERARY_MAX_POIS = 30
 
 # 일정 생성기
-st.subheader("🧳 나만의 여행 일정 만들기")
-days = st.slider("여행 일수를 선택하세요 (1~3일)", 1, 3, 2)
+# 슬라이더나 명소 선택을 바꾸면 이 부분만 다시 실행됩니다. (지도는 다시 만들거나 다시 보내지 않음)
+@st.fragment
+def show_itinerary():
+    with perf.start_rerun("02_관광지#itinerary"):
+        st.subheader("🧳 나만의 여행 일정 만들기")
+        days = st.slider("여행 일수를 선택하세요 (1~3일)", 1, 3, 2)
+        picked = st.multiselect(
+            f"일정에 넣을 명소를 고르세요 (최대 {ITINERARY_MAX_POIS}개)",
+            range(len(locations)),
+            default=range(min(10, len(locations))),
+            format_func=lambda i: locations[i]["name"],
+            max_selections=ITINERARY_MAX_POIS,
+        )
+        if not picked:
+            st.info("명소를 하나 이상 골라 주세요.")
+            return
 
-# 일정 나누기
-per_day = math.ceil(len(locations) / days)
-schedule = [locations[i:i+per_day] for i in range(0, len(locations), per_day)]
+        # 일정 나누기: 가까운 명소끼리 같은 날로 묶고, 하루 안에서는 이동 거리가 짧은 순서로 방문
+        with perf.stage("plan_itinerary"):
+            schedule = plan_itinerary([locations[i] for i in picked], days)
 
-for i, day in enumerate(schedule, start=1):
-    st.markdown(f"### 📅 Day {i}")
-    for loc in day:
-        st.markdown(f"- **{loc['name']}** ({loc['subway']}) — {loc['desc']}")
+        for i, (day, day_km) in enumerate(schedule, start=1):
+            st.markdown(f"### 📅 Day {i} (이동 거리 약 {day_km:.1f}km)")
+            for loc in day:
+                st.markdown(f"- **{loc['name']}** ({loc['subway']}) — {loc['desc']}")
 
 # 하단 표시 제거 (Streamlit 메뉴/푸터 숨김)
 hide_streamlit_style = """
@@ -93,4 +105,25 @@ hide_streamlit_style = """
     header {visibility: hidden;}
     </style>
 """
-st.markdown(hide_streamlit_style, unsafe_allow_html=True)
+
+# 기본 설정
+st.set_page_config(page_title="서울 관광지도", page_icon="🗺️", layout="wide")
+
+with perf.rerun("02_관광지"):
+    # 헤더
+    st.title("🗺️ 외국인이 좋아하는 서울 관광지 Top 10")
+    st.markdown("서울의 대표 명소들을 지도와 함께 살펴보고, 나만의 여행 일정을 만들어보세요! 🌸")
+
+    with perf.stage("data_version"):
+        versions = file_version(POI_FILE), file_version(STATIONS_FILE), file_version(SUBWAY_FILE)
+    with perf.stage("load_poi_index", cache=True):
+        pois, poi_index, locations = load_poi_index(*versions)
+
+    show_map()
+
+    # 관광지 요약 테이블
+    show_summary()
+
+    show_itinerary()
+
+    st.markdown(hide_streamlit_style, unsafe_allow_html=True)
@@ -1,79 +1,54 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from pathlib import Path
 
-# 1. 파일 로드 및 데이터 전처리 함수
-@st.cache_data
-def load_data(file_path):
-    """CSV 파일을 로드하고 컬럼명을 정리하며 데이터 타입을 변환합니다."""
-    
-    # Pathlib을 사용하여 현재 스크립트 위치 기준, 루트 폴더의 파일 경로를 찾습니다.
-    # pages/analysis_page.py -> pages/ -> 루트 폴더/dubbongispig.csv
-    data_file_path = Path(__file__).parent.parent / file_path 
-    
-    if not data_file_path.exists():
-        st.error(f"❌ 파일을 찾을 수 없습니다: {data_file_path}. CSV 파일이 **루트 폴더**에 있는지 확인해 주세요.")
-        return pd.DataFrame()
-        
-    # 파일 인코딩 처리
-    try:
-        df = pd.read_csv(data_file_path, encoding='utf-8')
-    except UnicodeDecodeError:
-        try:
-            df = pd.read_csv(data_file_path, encoding='cp949')
-        except Exception:
-            df = pd.read_csv(data_file_path, encoding='euc-kr')
-
-    # 컬럼명 클리닝
-    column_mapping = {
-        '순번': 'ID', '품종': 'Species', '시도': 'Sido', '시군': 'Sigungu', '년도': 'Year',
-        '전체호수': 'Total_Farms', '전체두수': 'Total_Heads',
-        '5000두 이상(호수)': '5k_up_Farms', '5000두 이상(두수)': '5k_up_Heads',
-        '5000두-2000두 이상(호수)': '5k_2k_Farms', '5000두-2000두 이상(두수)': '5k_2k_Heads',
-        '2000두-1000두 이상(호수)': '2k_1k_Farms', '2000두-1000두 이상(두수)': '2k_1k_Heads',
-        '1000두-500두 이상(호수)': '1k_500_Farms', '1000두-500두 이상(두수)': '1k_500_Heads',
-        '500두-100두 이상(호수)': '500_100_Farms', '500두-100두 이상(두수)': '500_100_Heads',
-        '100두-20두 이상(호수)': '100_20_Farms', '100두-20두 이상(두수)': '100_20_Heads',
-        '20두-0두 이상(호수)': '20_0_Farms', '20두-0두 이상(두수)': '20_0_Heads',
+from common import perf
+from common.artifacts import livestock_distribution, livestock_sigungu
+from common.charts import FIGURE_CACHE, rank_colors
+from common.data import frame_nbytes, resolve_path
+from common.cube import load_cube
+from common.distribution import NATIONAL
+from common.livestock import DATA_FILE, SIZE_BUCKETS, SIZE_HEADS_COLS, load_livestock
+from common.refresh import Refresher
+
+# 1. 데이터셋 (원본 표 + 파생 집계)
+# 백그라운드 스레드(common.refresh)가 파일을 지켜보다가 바뀌면 워커 스레드에서 전부 새로 만들어 통째로 바꿔 끼웁니다.
+# 리런은 파일을 읽지 않고 지금 들고 있는 버전을 바로 쓰며, 새 버전이 준비될 때까지 이전 버전을 계속 보여줍니다.
+# data_version(파일 내용 해시)은 그래프 캐시 키로 씁니다.
+def build_dataset():
+    """(갱신 스레드에서 실행) CSV → 원본 표, 롤업 큐브, 연도·시군별 합계, 농가 규모 분포 지표를 한 번에 만듭니다."""
+    # CSV 파싱과 컬럼 정리는 공용 데이터 계층에서 한 번만 하고, 이후에는 변환된 컬럼형 파일을 엽니다.
+    # (지역·품종은 category, 숫자는 값 범위에 맞는 가장 작은 정수 타입: common.livestock.SCHEMA)
+    # 집계 표는 미리 만든 파일(python -m common.precompute)이 있으면 그대로 엽니다.
+    dataset = {
+        "df": load_livestock(DATA_FILE),
+        "cube": load_cube(DATA_FILE),
+        "sigungu": livestock_sigungu(DATA_FILE),
+        "distribution": livestock_distribution(DATA_FILE),
     }
-    df.rename(columns=column_mapping, inplace=True)
+    perf.record_dataset("livestock", frame_nbytes(dataset["df"]))
+    perf.record_dataset("livestock_cube", frame_nbytes(dataset["cube"].base))
+    perf.record_dataset("livestock_sigungu", frame_nbytes(dataset["sigungu"]))
+    perf.record_dataset("livestock_distribution", frame_nbytes(dataset["distribution"]))
+    return dataset
 
-    # 데이터 타입 변환
-    numeric_cols = [col for col in df.columns if 'Heads' in col or 'Farms' in col or col in ['ID', 'Year']]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
-        
-    return df
+@st.cache_resource(on_release=Refresher.stop)
+def livestock_source():
+    """프로세스에 하나뿐인 갱신 스레드. 모든 세션이 같은 데이터셋을 같이 씁니다."""
+    perf.mark_miss()
+    return Refresher("livestock", DATA_FILE, build_dataset).start()
 
 # 2. Plotly 막대 그래프 생성 함수 (1등 빨강, 그라데이션 적용)
 def create_custom_bar_chart(df_filtered, year):
     
-    df_plot = df_filtered.groupby('Sigungu')['Total_Heads'].sum().reset_index()
+    df_plot = df_filtered.groupby('Sigungu', observed=True)['Total_Heads'].sum().reset_index()
     df_plot = df_plot.sort_values(by='Total_Heads', ascending=False)
     
     if df_plot.empty:
         return go.Figure()
 
-    # 색상 설정 로직
-    colors = []
-    max_heads = df_plot['Total_Heads'].max()
-    gradient_colors = px.colors.sequential.Blues_r
-    non_max_count = (df_plot['Total_Heads'] < max_heads).sum()
-    gradient_index = 0
-    
-    for heads in df_plot['Total_Heads']:
-        if heads == max_heads:
-            colors.append('#FF0000')  # 1등(최대값)은 빨간색
-        else:
-            if non_max_count > 0:
-                color_index = int(gradient_index / non_max_count * (len(gradient_colors) - 1))
-                colors.append(gradient_colors[color_index])
-                gradient_index += 1
-            else:
-                colors.append('#3776ab')
-            
+    # 색상 설정 로직: 1등(최대값)은 빨간색, 나머지는 Blues_r 그라데이션
+    colors = rank_colors(df_plot['Total_Heads'].to_numpy(), palette="blues")
 
     # Plotly 인터랙티브 막대 그래프 생성
     fig = go.Figure(data=[go.Bar(
@@ -95,19 +70,73 @@ def create_custom_bar_chart(df_filtered, year):
     
     return fig
 
+# 연도별 추이 그래프 생성 함수 (드릴다운용)
+def create_trend_chart(df_level, title):
+    fig = go.Figure(data=[go.Scatter(
+        x=df_level['Year'],
+        y=df_level['Total_Heads'],
+        mode='lines+markers+text',
+        text=df_level['Total_Heads'].apply(lambda x: f'{x:,}'),
+        textposition='top center',
+        hovertemplate="%{x}년<br>전체 두수: %{y:,.0f}두<extra></extra>",
+    )])
+    fig.update_layout(
+        title=title,
+        xaxis_title="연도",
+        yaxis_title="전체 두수 (두)",
+        xaxis={'type': 'category'},
+    )
+    return fig
+
+# 규모 구간별 농가당 평균 두수 막대 그래프 (작은 구간 → 큰 구간)
+def create_bucket_avg_chart(row, title):
+    buckets = SIZE_BUCKETS[::-1]
+    fig = go.Figure(data=[go.Bar(
+        x=buckets,
+        y=[row[f'{bucket}_Avg'] for bucket in buckets],
+        marker_color='steelblue',
+        hovertemplate="%{x} 구간<br>농가당 평균: %{y:,.0f}두<extra></extra>",
+    )])
+    fig.update_layout(
+        title=title,
+        xaxis_title="규모 구간",
+        yaxis_title="농가당 평균 두수 (두)",
+    )
+    return fig
+
+# 집중도·지니 계수 연도별 추이 그래프
+def create_concentration_chart(df_level, title):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=df_level['Year'], y=df_level['Large_Share'], mode='lines+markers', name='대규모 농가 두수 비중'))
+    fig.add_trace(go.Scatter(x=df_level['Year'], y=df_level['Gini'], mode='lines+markers', name='지니 계수'))
+    fig.update_layout(
+        title=title,
+        xaxis_title="연도",
+        yaxis={'title': "지표 (0~1)", 'range': [0, 1]},
+        xaxis={'type': 'category'},
+    )
+    return fig
+
 # 3. Streamlit 메인 앱 구성
 def main():
+    with perf.rerun("07_수행평가"):
+        render_page()
+
+def render_page():
     st.set_page_config(layout="wide", page_title="가축 사육 현황 분석 (Streamlit/Plotly)")
     
     st.title("🐇 가축 사육 현황 분석 (토끼) - Streamlit 대시보드")
     st.markdown("---")
 
-    # 데이터 로드
-    df = load_data('dubbongispig.csv')
+    # 지금 들고 있는 데이터셋 (서버가 막 떴을 때만 첫 빌드를 기다림)
+    with perf.stage("dataset", cache=True):
+        data_version, dataset = livestock_source().get()
 
-    if df.empty:
+    if dataset is None:
+        st.error(f"❌ 파일을 찾을 수 없습니다: {resolve_path(DATA_FILE)}. CSV 파일이 **루트 폴더**에 있는지 확인해 주세요.")
         st.stop()
-        
+
+    df = dataset["df"]
     data_years = df['Year'].unique()
     latest_year = df['Year'].max()
     
@@ -121,11 +150,12 @@ def main():
     col3.metric("데이터 기간", f"{min(data_years)}년 ~ {latest_year}년")
 
     st.subheader(f"규모별 사육 현황 ({latest_year}년 기준)")
-    df_latest_summary = df[df['Year'] == latest_year]
+    cube = dataset["cube"]
+    national = cube.level('national')
+    df_latest_summary = national[national['Year'] == latest_year]
     
     if not df_latest_summary.empty:
-        size_cols_heads = [col for col in df_latest_summary.columns if 'Heads' in col and col != 'Total_Heads']
-        size_summary = df_latest_summary[size_cols_heads].sum().sort_values(ascending=False)
+        size_summary = df_latest_summary[SIZE_HEADS_COLS].iloc[0].sort_values(ascending=False)
         
         st.dataframe(
             size_summary.rename(lambda x: x.replace('_Heads', ' 이상 두수')),
@@ -144,11 +174,18 @@ def main():
     requested_year = 2024 # 2025년에서 2024년으로 변경
     st.subheader(f"✅ 요청하신 **{requested_year}년도 10월** 기록 시각화 (데이터를 {requested_year}년으로 필터링)")
     
-    df_2024 = df[df['Year'] == requested_year] 
-    fig_2024 = create_custom_bar_chart(df_2024, f"{requested_year}년")
+    # 같은 (데이터 버전, 연도)면 필터링·집계·그래프 생성을 건너뛰고 캐시된 그래프를 씁니다.
+    # 그래프를 새로 그릴 때도 원본 대신 연도·시군별로 미리 합쳐 둔 표에서 해당 연도만 꺼냅니다.
+    def build_sigungu_chart():
+        totals = dataset["sigungu"]
+        return create_custom_bar_chart(totals[totals['Year'] == requested_year], f"{requested_year}년")
+
+    with perf.stage("figure_sigungu"):
+        fig_2024 = FIGURE_CACHE.get_or_build(("livestock_sigungu", data_version, requested_year), build_sigungu_chart)
     
     if fig_2024.data:
-        st.plotly_chart(fig_2024, use_container_width=True)
+        with perf.stage("plotly_chart"):
+            st.plotly_chart(fig_2024, use_container_width=True)
         st.caption("✅ **큰 값부터 정렬**, **1등**은 **빨간색**, **나머지**는 **파란색 계열 그라데이션**으로 처리되었습니다.")
     else:
         # 이 부분이 실행되는 경우는 없어야 하지만, 혹시 모를 에러 방지
@@ -157,7 +194,131 @@ def main():
     st.markdown("---")
     
     # 이전 단계에서 보여주던 2024년 시연 그래프는 요청하신 2024년 필터링으로 대체되어 제거했습니다.
-    
+
+    # --- 3. 롤업 큐브 기반 연도·지역 드릴다운 ---
+    render_drilldown(cube, data_version)
+
+    st.markdown("---")
+
+    # --- 4. 농가 규모 분포 분석 ---
+    render_size_distribution(dataset["distribution"], data_version)
+
+def render_drilldown(cube, data_version):
+    st.header("3. 연도·지역 드릴다운")
+    st.caption("미리 집계해 둔 롤업 큐브에서 바로 꺼내 보여줍니다. 증감은 바로 이전 기록 연도 대비입니다.")
+
+    species_level = cube.level('species')
+    sido_level = cube.level('sido')
+    sigungu_level = cube.level('sigungu')
+
+    col1, col2, col3 = st.columns(3)
+    species = col1.selectbox("품종", sorted(species_level['Species'].unique()))
+    sido_in_species = sido_level[sido_level['Species'] == species]
+    sido = col2.selectbox("시도", ["전체"] + sorted(sido_in_species['Sido'].unique()))
+
+    if sido == "전체":
+        sigungu = "전체"
+        view = species_level[species_level['Species'] == species]
+        label = f"{species} · 전국"
+    else:
+        sigungu_in_sido = sigungu_level[(sigungu_level['Species'] == species) & (sigungu_level['Sido'] == sido)]
+        sigungu = col3.selectbox("시군", ["전체"] + sorted(sigungu_in_sido['Sigungu'].unique()))
+        if sigungu == "전체":
+            view = sido_in_species[sido_in_species['Sido'] == sido]
+            label = f"{species} · {sido}"
+        else:
+            view = sigungu_in_sido[sigungu_in_sido['Sigungu'] == sigungu]
+            label = f"{species} · {sido} {sigungu}"
+
+    if view.empty:
+        st.info("선택한 지역의 기록이 없습니다.")
+        return
+
+    latest = view.iloc[-1]
+    delta = latest['Total_Heads_YoY']
+    st.metric(
+        f"{label} 전체 두수 ({latest['Year']}년)",
+        f"{int(latest['Total_Heads']):,}두",
+        delta=None if pd.isna(delta) else f"{int(delta):,}두",
+    )
+
+    with perf.stage("figure_trend"):
+        fig_trend = FIGURE_CACHE.get_or_build(
+            ("livestock_trend", data_version, species, sido, sigungu),
+            lambda: create_trend_chart(view, f"**{label} 연도별 전체 두수**"),
+        )
+    with perf.stage("plotly_chart"):
+        st.plotly_chart(fig_trend, use_container_width=True)
+
+    st.dataframe(
+        view[['Year', 'Total_Farms', 'Total_Heads', 'Total_Farms_YoY', 'Total_Heads_YoY']],
+        column_config={
+            "Year": st.column_config.NumberColumn("연도", format="%d"),
+            "Total_Farms": st.column_config.NumberColumn("전체 호수", format="%d호"),
+            "Total_Heads": st.column_config.NumberColumn("전체 두수", format="%d두"),
+            "Total_Farms_YoY": st.column_config.NumberColumn("호수 증감", format="%+d"),
+            "Total_Heads_YoY": st.column_config.NumberColumn("두수 증감", format="%+d"),
+        },
+        use_container_width=True,
+        hide_index=True,
+    )
+
+def render_size_distribution(dist, data_version):
+    st.header("4. 농가 규모 분포 분석")
+    st.caption(
+        "대규모 농가 두수 비중은 1,000두 이상 구간이 전체 두수에서 차지하는 비율입니다. "
+        "지니 계수와 HHI는 구간 안의 농가가 모두 구간 평균 두수를 기른다고 보고 계산한 근삿값입니다."
+    )
+
+    col1, col2, col3 = st.columns(3)
+    species = col1.selectbox("품종", sorted(dist['Species'].unique()), key="dist_species")
+    in_species = dist[dist['Species'] == species]
+    year = col2.selectbox("연도", sorted(in_species['Year'].unique(), reverse=True), key="dist_year")
+    sido = col3.selectbox("지역", [NATIONAL] + sorted(set(in_species['Sido']) - {NATIONAL}), key="dist_sido")
+
+    view = in_species[in_species['Sido'] == sido]
+    selected = view[view['Year'] == year]
+    if selected.empty:
+        st.info("선택한 연도·지역의 기록이 없습니다.")
+        return
+    row = selected.iloc[0]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("대규모 농가 두수 비중", "-" if pd.isna(row['Large_Share']) else f"{row['Large_Share']:.1%}")
+    col2.metric("지니 계수", "-" if pd.isna(row['Gini']) else f"{row['Gini']:.3f}")
+    col3.metric("HHI", "-" if pd.isna(row['HHI']) else f"{row['HHI']:,.1f}")
+
+    with perf.stage("figure_distribution"):
+        fig_avg = FIGURE_CACHE.get_or_build(
+            ("livestock_bucket_avg", data_version, species, sido, year),
+            lambda: create_bucket_avg_chart(row, f"**{species} · {sido} {year}년 규모 구간별 농가당 평균 두수**"),
+        )
+        fig_concentration = FIGURE_CACHE.get_or_build(
+            ("livestock_concentration", data_version, species, sido),
+            lambda: create_concentration_chart(view, f"**{species} · {sido} 연도별 집중도**"),
+        )
+    with perf.stage("plotly_chart"):
+        col1, col2 = st.columns(2)
+        col1.plotly_chart(fig_avg, use_container_width=True)
+        col2.plotly_chart(fig_concentration, use_container_width=True)
+
+    st.subheader(f"{species} 시도별 규모 분포 ({year}년)")
+    st.dataframe(
+        in_species[in_species['Year'] == year].sort_values('Large_Share', ascending=False)[
+            ['Sido', 'Farms', 'Heads', 'Large_Share', 'Gini', 'HHI']
+        ],
+        column_config={
+            "Sido": st.column_config.TextColumn("지역"),
+            "Farms": st.column_config.NumberColumn("전체 호수", format="%d호"),
+            "Heads": st.column_config.NumberColumn("전체 두수", format="%d두"),
+            "Large_Share": st.column_config.ProgressColumn("대규모 농가 두수 비중", format="%.2f", min_value=0, max_value=1),
+            "Gini": st.column_config.NumberColumn("지니 계수", format="%.3f"),
+            "HHI": st.column_config.NumberColumn("HHI", format="%.1f"),
+        },
+        use_container_width=True,
+        hide_index=True,
+    )
+
 
 if __name__ == '__main__':
     main()